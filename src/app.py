@@ -5,8 +5,13 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_wtf.csrf import CSRFProtect, CSRFError
 import os
+import copy
 import uuid
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from logging.handlers import RotatingFileHandler
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
@@ -70,7 +75,7 @@ limiter = Limiter(
 
 # Configure upload folder
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'uploads')
-ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc', 'txt', 'rtf'}
+ALLOWED_EXTENSIONS = frozenset({'pdf', 'docx', 'doc', 'txt', 'rtf'})
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # 10MB max file size
@@ -127,7 +132,72 @@ def allowed_file(filename: str) -> bool:
     Returns:
         bool: True if the file extension is allowed, False otherwise
     """
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in ALLOWED_EXTENSIONS
+
+# Completed analyses keyed by the digests of the uploaded file pair, so a
+# repeated upload skips parsing and scoring. Least recently used first.
+ANALYSIS_CACHE_SIZE = 256
+_analysis_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# One verb enhancer for every request, so its spaCy model and its caches
+# are loaded once and shared across uploads. The lock also serializes use,
+# as the enhancer's caches are plain dicts.
+_verb_enhancer: Optional[ActionVerbEnhancer] = None
+_verb_enhancer_lock = threading.Lock()
+
+def _enhance_verbs(text: str) -> List[Dict[str, Any]]:
+    """
+    Run action verb enhancement with the shared enhancer, building it on first use.
+    
+    Args:
+        text: Resume text containing bullet points
+        
+    Returns:
+        List of enhancement suggestions for each bullet point
+    """
+    global _verb_enhancer
+    with _verb_enhancer_lock:
+        if _verb_enhancer is None:
+            _verb_enhancer = ActionVerbEnhancer()
+        return _verb_enhancer.enhance_bullet_points(text)
+
+def _file_digest(file) -> str:
+    """
+    Hash an uploaded file's content without loading it all at once.
+    
+    Args:
+        file: The uploaded file; its stream is rewound afterwards
+        
+    Returns:
+        str: Hex SHA-256 digest of the file content
+    """
+    digest = hashlib.sha256()
+    file.stream.seek(0)
+    for chunk in iter(lambda: file.stream.read(64 * 1024), b''):
+        digest.update(chunk)
+    file.stream.seek(0)
+    return digest.hexdigest()
+
+def _get_cached_analysis(key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+    """Return a copy of the cached (similarity, analysis) for key, if any."""
+    with _analysis_cache_lock:
+        entry = _analysis_cache.get(key)
+        if entry is None:
+            return None
+        _analysis_cache.move_to_end(key)
+    similarity, analysis = entry
+    return similarity, copy.deepcopy(analysis)
+
+def _cache_analysis(key: str, similarity: float, analysis: Dict[str, Any]) -> None:
+    """Store a copy of a completed analysis, evicting the oldest if full."""
+    entry = (similarity, copy.deepcopy(analysis))
+    with _analysis_cache_lock:
+        _analysis_cache[key] = entry
+        _analysis_cache.move_to_end(key)
+        while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
 
 @app.route('/')
 def index():
@@ -187,10 +257,10 @@ def batch_upload():
         
         # Validate job description
         try:
+            validate_file_size(job_desc, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
             job_desc_filename, job_desc_ext = validate_file_upload(
                 job_desc, 'Job Description', ALLOWED_EXTENSIONS
             )
-            validate_file_size(job_desc, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
             is_valid, error_msg = validate_file_content(job_desc, ALLOWED_EXTENSIONS)
             if not is_valid:
                 return error_response(error_msg)
@@ -208,10 +278,10 @@ def batch_upload():
         try:
             for resume_file in resume_files:
                 try:
+                    validate_file_size(resume_file, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
                     resume_filename, resume_ext = validate_file_upload(
                         resume_file, 'Resume', ALLOWED_EXTENSIONS
                     )
-                    validate_file_size(resume_file, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
                     is_valid, error_msg = validate_file_content(resume_file, ALLOWED_EXTENSIONS)
                     if not is_valid:
                         raise ValidationError(f"{resume_file.filename}: {error_msg}")
@@ -313,11 +383,11 @@ def upload_file():
         job_desc = request.files['job_description']
         
         try:
-            # Validate resume file
+            # Validate resume file, rejecting oversized uploads first
+            validate_file_size(resume, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
             resume_filename, resume_ext = validate_file_upload(
                 resume, 'Resume', ALLOWED_EXTENSIONS
             )
-            validate_file_size(resume, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
             
             # Security validation for resume content
             is_valid, error_msg = validate_file_content(resume, ALLOWED_EXTENSIONS)
@@ -328,10 +398,10 @@ def upload_file():
             resume_filename = sanitize_filename(resume_filename)
             
             # Validate job description file
+            validate_file_size(job_desc, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
             job_desc_filename, job_desc_ext = validate_file_upload(
                 job_desc, 'Job Description', ALLOWED_EXTENSIONS
             )
-            validate_file_size(job_desc, app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024))
             
             # Security validation for job description content
             is_valid, error_msg = validate_file_content(job_desc, ALLOWED_EXTENSIONS)
@@ -343,6 +413,17 @@ def upload_file():
         except ValidationError as e:
             return error_response(str(e))
         
+        # Reuse the analysis of an identical earlier upload
+        cache_key = ':'.join((
+            resume_ext, _file_digest(resume), job_desc_ext, _file_digest(job_desc)
+        ))
+        cached = _get_cached_analysis(cache_key)
+        if cached is not None:
+            similarity, analysis = cached
+            return _save_and_respond(
+                resume_filename, job_desc_filename, similarity, analysis
+            )
+        
         # Save files
         resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume_filename)
         job_desc_path = os.path.join(app.config['UPLOAD_FOLDER'], job_desc_filename)
@@ -422,8 +503,7 @@ def upload_file():
             }
                 # Run action verb enhancement
             try:
-                enhancer = ActionVerbEnhancer()
-                verb_enhancements = enhancer.enhance_bullet_points(parser.text)
+                verb_enhancements = _enhance_verbs(parser.text)
                 analysis['verb_enhancements'] = verb_enhancements
             except Exception as e:
                 # Non-fatal: skip verb analysis but log the error
@@ -471,27 +551,16 @@ def upload_file():
             except Exception as e:
                 app.logger.error(f"Failed to clean up uploaded files: {str(e)}")
         
-        # Save analysis to database
-        try:
-            if 'session_id' not in session:
-                session['session_id'] = str(uuid.uuid4())
-            
-            analysis_id = save_analysis(
-                session_id=session['session_id'],
-                resume_filename=resume_filename,
-                job_desc_filename=job_desc_filename,
-                similarity_score=similarity,
-                analysis_data=analysis
-            )
-            analysis['id'] = analysis_id
-        except Exception as e:
-            app.logger.error(f"Failed to save analysis to database: {str(e)}")
-            # Non-fatal: continue even if save fails
+        # Only complete analyses are reused; a failed optional step leaves a
+        # warning or a None field, and the next identical upload retries it
+        if ('warnings' not in analysis
+                and analysis.get('format_analysis') is not None
+                and analysis.get('template_recommendation') is not None):
+            _cache_analysis(cache_key, similarity, analysis)
         
-        return jsonify({
-            'message': 'Analysis completed successfully',
-            'analysis': analysis
-        })
+        return _save_and_respond(
+            resume_filename, job_desc_filename, similarity, analysis
+        )
         
     except RequestEntityTooLarge:
         return error_response(
@@ -549,6 +618,42 @@ def upload_file():
             status_code=500
         )
 
+def _save_and_respond(resume_filename: str, job_desc_filename: str,
+                      similarity: float, analysis: Dict[str, Any]):
+    """
+    Save an analysis to the session history and build the upload response.
+    
+    Args:
+        resume_filename: Sanitized resume filename
+        job_desc_filename: Sanitized job description filename
+        similarity: Similarity score of the analysis
+        analysis: The analysis results; its 'id' is set once saved
+        
+    Returns:
+        JSON response with the analysis results
+    """
+    # Save analysis to database
+    try:
+        if 'session_id' not in session:
+            session['session_id'] = str(uuid.uuid4())
+        
+        analysis_id = save_analysis(
+            session_id=session['session_id'],
+            resume_filename=resume_filename,
+            job_desc_filename=job_desc_filename,
+            similarity_score=similarity,
+            analysis_data=analysis
+        )
+        analysis['id'] = analysis_id
+    except Exception as e:
+        app.logger.error(f"Failed to save analysis to database: {str(e)}")
+        # Non-fatal: continue even if save fails
+    
+    return jsonify({
+        'message': 'Analysis completed successfully',
+        'analysis': analysis
+    })
+
 if __name__ == '__main__':
     debug = os.environ.get('FLASK_DEBUG', '1') == '1'
     app.run(debug=debug)
\ No newline at end of file
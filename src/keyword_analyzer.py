@@ -6,6 +6,13 @@ import re
 from collections import defaultdict
 import spacy
 
+# Try to import pyahocorasick, but make it optional
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 class IndustryKeywordAnalyzer:
     """Analyze industry-specific keywords in resumes and job descriptions."""
     
@@ -90,6 +97,35 @@ class IndustryKeywordAnalyzer:
             'world-class': 0.4,
             'bleeding-edge': 0.3
         }
+        
+        # Lower-cased terms of every industry, matched against a text in a
+        # single pass when pyahocorasick is available
+        self._lower_terms = {
+            term.lower()
+            for categories in self.industry_terms.values()
+            for terms in categories.values()
+            for term in terms
+        }
+        self._term_automaton = None
+        if HAS_AHOCORASICK:
+            self._term_automaton = ahocorasick.Automaton()
+            for term in self._lower_terms:
+                self._term_automaton.add_word(term, term)
+            self._term_automaton.make_automaton()
+    
+    def _terms_in(self, text_lower: str) -> Set[str]:
+        """
+        Find which industry terms occur in a text.
+        
+        Args:
+            text_lower: Lower-cased text to search
+            
+        Returns:
+            Set of the lower-cased terms that occur as substrings of the text
+        """
+        if self._term_automaton is not None:
+            return {term for _, term in self._term_automaton.iter(text_lower)}
+        return {term for term in self._lower_terms if term in text_lower}
     
     def detect_industry(self, text: str) -> List[Tuple[str, float]]:
         """
@@ -101,7 +137,7 @@ class IndustryKeywordAnalyzer:
         Returns:
             List of (industry, confidence) tuples, sorted by confidence
         """
-        text_lower = text.lower()
+        found = self._terms_in(text.lower())
         industry_scores = defaultdict(float)
         
         # Calculate scores for each industry
@@ -112,7 +148,7 @@ class IndustryKeywordAnalyzer:
             for category_terms in categories.values():
                 for term in category_terms:
                     total_terms += 1
-                    if term.lower() in text_lower:
+                    if term.lower() in found:
                         matched_terms += 1
             
             if total_terms > 0:
@@ -138,7 +174,7 @@ class IndustryKeywordAnalyzer:
         Returns:
             Dictionary mapping categories to found keywords
         """
-        text_lower = text.lower()
+        found = self._terms_in(text.lower())
         found_terms = defaultdict(list)
         
         # If no industries specified, analyze all
@@ -150,7 +186,7 @@ class IndustryKeywordAnalyzer:
             if industry in self.industry_terms:
                 for category, terms in self.industry_terms[industry].items():
                     for term in terms:
-                        if term.lower() in text_lower:
+                        if term.lower() in found:
                             found_terms[f"{industry}_{category}"].append(term)
         
         return dict(found_terms)
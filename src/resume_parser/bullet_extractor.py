@@ -45,6 +45,25 @@ class BulletPointExtractor:
     # Compiled regex for bullet point starters
     BULLET_START_REGEX = re.compile('|'.join(BULLET_START_PATTERNS), re.IGNORECASE)
     
+    # Line-start markers recognized by extract_bullet_points: bullet
+    # characters, then numbered and lettered items, as one alternation so
+    # each line is matched once
+    LINE_MARKER_REGEX = re.compile(
+        r'^\s*(?:[\u2022\u00B7\-\*\u25CB\u25AA\u25E6\u2192]\s+|[\d]+[\.\)]\s+|[a-zA-Z]\)\s+)'
+    )
+    
+    # Markers removed from extracted points by _clean_bullet_points
+    CLEAN_BULLET_REGEX = re.compile(r'^[\u2022\u00B7\-\*\u25CB\u25AA\u25E6\u2192]\s+')
+    CLEAN_NUMBERED_REGEX = re.compile(r'^\s*[\d]+[\.\)]\s+')
+    CLEAN_LETTER_REGEX = re.compile(r'^\s*[a-zA-Z]\)\s+')
+    
+    # Top-level headers are section markers, not list headings
+    TOP_LEVEL_HEADERS = frozenset({
+        'experience', 'education', 'skills', 'summary', 'contact',
+        'work', 'work experience', 'key achievements', 'project highlights',
+        'achievements', 'projects'
+    })
+    
     @classmethod
     def extract_bullet_points(cls, text: str) -> List[str]:
         """
@@ -61,10 +80,7 @@ class BulletPointExtractor:
         current_bullet = None
         in_list = False  # Track if we're inside a bullet list section
 
-        # simple patterns
-        numbered_re = re.compile(r'^\s*[\d]+[\.\)]\s+')
-        letter_re = re.compile(r'^\s*[a-zA-Z]\)\s+')
-        bullet_char_re = re.compile(r'^\s*[\u2022\u00B7\-\*\u25CB\u25AA\u25E6\u2192]\s+')
+        marker_re = cls.LINE_MARKER_REGEX
 
         for i, raw in enumerate(lines):
             if raw is None:
@@ -85,18 +101,13 @@ class BulletPointExtractor:
                     nl = lines[j].strip()
                     if not nl:
                         continue
-                    if bullet_char_re.match(nl) or numbered_re.match(nl) or letter_re.match(nl):
+                    if marker_re.match(nl):
                         next_is_bullet = True
                     break
 
                 # Skip top-level headers (they are section markers, not list headings)
-                top_level_headers = {
-                    'experience', 'education', 'skills', 'summary', 'contact',
-                    'work', 'work experience', 'key achievements', 'project highlights',
-                    'achievements', 'projects'
-                }
                 low = stripped.lower().rstrip(':').strip()
-                if low in top_level_headers:
+                if low in cls.TOP_LEVEL_HEADERS:
                     continue
 
                 if in_list or next_is_bullet:
@@ -109,7 +120,7 @@ class BulletPointExtractor:
                     continue
 
             # Check for bullet markers
-            bullet_marker = bullet_char_re.match(line) or numbered_re.match(line) or letter_re.match(line)
+            bullet_marker = marker_re.match(line)
             if bullet_marker:
                 in_list = True  # Found first bullet in a list
                 if current_bullet:
@@ -148,9 +159,9 @@ class BulletPointExtractor:
         cleaned = []
         for point in bullet_points:
             # Remove only bullet markers while preserving special characters
-            point = re.sub(r'^[\u2022\u00B7\-\*\u25CB\u25AA\u25E6\u2192]\s+', '', point)
-            point = re.sub(r'^\s*[\d]+[\.\)]\s+', '', point)  # Remove numbered bullets
-            point = re.sub(r'^\s*[a-zA-Z]\)\s+', '', point)   # Remove letter bullets
+            point = cls.CLEAN_BULLET_REGEX.sub('', point)
+            point = cls.CLEAN_NUMBERED_REGEX.sub('', point)  # Remove numbered bullets
+            point = cls.CLEAN_LETTER_REGEX.sub('', point)   # Remove letter bullets
             
             # Clean up whitespace
             point = ' '.join(point.split())
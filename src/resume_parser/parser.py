@@ -8,20 +8,158 @@ implementation focuses on stability and clear return shapes.
 """
 import os
 import re
+import zipfile
+import xml.etree.ElementTree as ET
 import spacy
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Tuple
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-import docx
 import io
+from concurrent.futures import ProcessPoolExecutor
 from pdfminer.high_level import extract_text
 from .bullet_extractor import BulletPointExtractor
 from .cache import ResumeCache
 
+# Folds the alternate skill delimiters onto ',' so a plain str.split suffices
+_DELIM_TO_COMMA = str.maketrans({';': ',', '/': ','})
+
+# All contact fields in one alternation so the contact block is scanned once;
+# m.lastgroup names the field that matched.
+_CONTACT_RE = re.compile(
+    r'(?P<email>[\w\.-]+@[\w\.-]+\.\w+)'
+    r'|(?P<phone>(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(?P<linkedin>linkedin\.com/in/[\w\-]+)'
+    r'|(?P<github>github\.com/[\w\-]+)'
+    r'|(?P<location>[A-Z][a-zA-Z\s-]+,\s*[A-Z]{2}(?:\s*\d{5})?)'
+)
+_CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github', 'location')
+
+# Experience entry parsing. Titles and dates are tried pattern by pattern, so
+# they stay separate rather than being folded into one alternation.
+_YEAR_RE = re.compile(r'(?:19|20)\d{2}')
+_TITLE_RES = tuple(re.compile(pattern, re.I) for pattern in (
+    r'(?:senior|lead|principal|staff)?\s*(?:software|systems?|data)',
+    r'(?:engineer|developer|architect|scientist|analyst)',
+    r'(?:tech|engineering|development|product|program|project)',
+    r'(?:lead|manager|director|head|chief|vp|supervisor)',
+    r'(?:frontend|backend|full\s*stack|web|mobile)\s*developer'
+))
+_AT_COMPANY_RE = re.compile(r'(?:@|at|\bat\b)\s+[A-Z][a-zA-Z0-9\s&\.,]+', re.I)
+_COMPANY_RE = re.compile(r'(?:@|at|\bat\b)\s+([A-Z][a-zA-Z0-9\s&\.,]+)(?:,|\s|$)', re.I)
+_TRAILING_COMMA_RE = re.compile(r',\s*$')
+_AT_SPLIT_RE = re.compile(r'\s+at\s+', re.I)
+_ENGINEER_TITLE_RE = re.compile(r'((?:senior|lead|principal|staff)\s+)?(?:software|data)\s+engineer', re.I)
+_PRESENT_RE = re.compile(r'present|current|now', re.I)
+_DATE_RES = tuple(re.compile(pattern) for pattern in (
+    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
+    r'\d{4}-\d{2}',
+    r'\d{2}/\d{4}'
+))
+_LOCATION_RE = re.compile(r'[A-Z][a-zA-Z\s-]+,\s*[A-Z]{2}(?:\s*\d{5})?')
+_TECHNOLOGY_RE = re.compile(r'using|with|through|via|built\s+(?:with|using)', re.I)
+_IMPACT_RE = re.compile(r'increased|decreased|reduced|improved|achieved|won', re.I)
+
+# Education entry parsing
+_DEGREE_RES = {
+    level: re.compile('|'.join(patterns), re.IGNORECASE)
+    for level, patterns in {
+        'bachelors': [
+            r"bachelor'?s?(?:\sof\s(?:science|arts|engineering|business))?",
+            r"b\.?(?:s|a|e|b\.?a)",
+            r"undergraduate degree",
+        ],
+        'masters': [
+            r"master'?s?(?:\sof\s(?:science|arts|engineering|business))?",
+            r"m\.?(?:s|a|e|b\.?a)",
+            r"graduate degree",
+        ],
+        'phd': [
+            r"ph\.?d",
+            r"doctor(?:ate)?\sof\sphilosophy",
+            r"doctoral degree",
+        ]
+    }.items()
+}
+_MAJOR_RE = re.compile('|'.join([
+    r"(?:in|of)\s+([A-Za-z\s]+?)(?:\s*,|\s+Expected|\s+\d{4}|$)",  # "... in Computer Science, 2024"
+    r"([^,\.]+)\smajor",      # "Computer Science major"
+]), re.IGNORECASE)
+_EDUCATION_DETAIL_RE = re.compile(r'(?:19|20)\d{2}|gpa|bachelor|master|phd|degree', re.I)
+_DEGREE_MAJOR_RE = re.compile(r'(?:bachelor|master|doctor).*?\s+in\s+([A-Za-z\s]+?)(?:\s*,|\s+Expected|\s+\d{4}|$)', re.I)
+_MAJOR_PREFIX_RE = re.compile(r'^(?:Science|Arts|Engineering|Business)\s+in\s+', re.I)
+_GRADUATION_RE = re.compile(r'(?:expected|anticipated)?\s*(?:19|20)\d{2}', re.I)
+_GPA_RE = re.compile(r'(?:gpa|grade point average)[:\s]+([0-9.]+)', re.I)
+
+# WordprocessingML names used when streaming DOCX text
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_DOCX_BODY = [_W + 'document', _W + 'body']
+_DOCX_PARAGRAPH = _DOCX_BODY + [_W + 'p']
+_DOCX_RUN_PARENTS = ([_W + 'r'], [_W + 'hyperlink', _W + 'r'])
+_DOCX_RUN_TEXT = {_W + 'tab': '\t', _W + 'ptab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+
+
+def _docx_text(file_path: str) -> str:
+    """Extract the text of a DOCX file's body paragraphs.
+
+    Streams word/document.xml instead of building a python-docx Document,
+    so memory stays flat however large the file is. Text follows
+    python-docx's Paragraph.text: runs and hyperlink runs directly in a
+    body paragraph, with tabs and line breaks as '\\t' and '\\n', and empty
+    paragraphs skipped.
+    """
+    paragraphs = []
+    parts = []
+    # Tags of the open ancestors of the current element
+    path = []
+    with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as xml:
+        for event, el in ET.iterparse(xml, events=('start', 'end')):
+            if event == 'start':
+                path.append(el.tag)
+                continue
+            path.pop()
+            if path == _DOCX_BODY:
+                # A paragraph, table or section properties element closed
+                text = ''.join(parts)
+                if text and el.tag == _W + 'p':
+                    paragraphs.append(text)
+                parts = []
+                el.clear()
+            elif path[:3] == _DOCX_PARAGRAPH and path[3:] in _DOCX_RUN_PARENTS:
+                if el.tag == _W + 't':
+                    parts.append(el.text or '')
+                elif el.tag == _W + 'br':
+                    if el.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                elif el.tag in _DOCX_RUN_TEXT:
+                    parts.append(_DOCX_RUN_TEXT[el.tag])
+    return "\n".join(paragraphs)
+
+
+def _extract_file_text(file_path: str) -> str:
+    """Extract raw text from a PDF, DOCX or plain-text file.
+
+    Kept at module level so it can be shipped to worker processes without
+    pickling a ResumeParser (and its spaCy pipeline) along with it.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    try:
+        if ext == '.pdf':
+            return extract_text(file_path) or ""
+        if ext == '.docx':
+            return _docx_text(file_path)
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    except Exception:
+        return ""
+
 
 class ResumeParser:
     """A lightweight resume parser with predictable outputs for tests."""
 
+    # spaCy pipeline to load; the environment variable lets deployments and
+    # the test suite pick a different model
+    SPACY_MODEL = os.environ.get('RESUME_PARSER_SPACY_MODEL', 'en_core_web_sm')
+    
     # Class-level cached NLP objects to avoid reloading per request
     _NLP = None
     _MATCHER = None
@@ -32,11 +170,13 @@ class ResumeParser:
         self.section_details: Dict[str, Dict[str, Any]] = {}
         self.bullet_extractor = BulletPointExtractor()
         self.cache = ResumeCache()
+        # Per-instance memo of get_* results keyed on (method, input text)
+        self._result_cache: Dict[Tuple[str, str], Any] = {}
         
         # Load spaCy model once (singleton pattern)
         try:
             if ResumeParser._NLP is None:
-                ResumeParser._NLP = spacy.load('en_core_web_sm')
+                ResumeParser._NLP = spacy.load(self.SPACY_MODEL)
             self.nlp = ResumeParser._NLP
             if ResumeParser._MATCHER is None and self.nlp:
                 ResumeParser._MATCHER = spacy.matcher.PhraseMatcher(self.nlp.vocab, attr="LOWER")
@@ -72,10 +212,20 @@ class ResumeParser:
             "Terraform", "Ansible"
         ]
         
-        # Add patterns to matcher
-        self.matcher.add("PROGRAMMING", [self.nlp(text) for text in programming_skills])
-        self.matcher.add("FRAMEWORK", [self.nlp(text) for text in frameworks])
-        self.matcher.add("TOOL", [self.nlp(text) for text in tools])
+        # Add patterns to matcher. It matches on lower-cased token text, so
+        # the patterns only need tokenizing, not the whole pipeline
+        tokenize = self.nlp.tokenizer.pipe
+        self.matcher.add("PROGRAMMING", list(tokenize(programming_skills)))
+        self.matcher.add("FRAMEWORK", list(tokenize(frameworks)))
+        self.matcher.add("TOOL", list(tokenize(tools)))
+    
+    def _reset_text(self) -> None:
+        """Forget the current resume so the instance can take another."""
+        self.text = ""
+        self.sections = {}
+        self.section_details = {}
+        self._result_cache.clear()
+        self.__dict__.pop('doc', None)
     
     def extract_text_from_pdf(self, file_path: str) -> str:
         """Extract text from a PDF file using pdfminer.six."""
@@ -85,16 +235,24 @@ class ResumeParser:
             return ""
     
     def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from a DOCX file using python-docx."""
+        """Extract text from a DOCX file."""
         try:
-            doc = docx.Document(file_path)
-            paragraphs = [p.text for p in doc.paragraphs if p.text]
-            return "\n".join(paragraphs)
+            return _docx_text(file_path)
         except Exception:
             return ""
     
+    def _extract_any(self, file_path: str) -> str:
+        """Extract text from a file, dispatching on its extension."""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.pdf':
+            return self.extract_text_from_pdf(file_path)
+        if ext == '.docx':
+            return self.extract_text_from_docx(file_path)
+        return _extract_file_text(file_path)
+    
     def parse_resume(self, file_path: str = None) -> Dict[str, Dict[str, Any]]:
         """Parse resume into sections with caching."""
+        self._result_cache.clear()
         # Try cache first
         if file_path:
             try:
@@ -111,18 +269,87 @@ class ResumeParser:
         
         # Extract text if needed
         if file_path:
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext == '.pdf':
-                self.text = self.extract_text_from_pdf(file_path)
-            elif ext == '.docx':
-                self.text = self.extract_text_from_docx(file_path)
-            else:
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        self.text = f.read()
-                except Exception:
-                    self.text = ""
+            self.text = self._extract_any(file_path)
         
+        details = self._build_section_details()
+        
+        # Cache results
+        self.section_details = details
+        if file_path:
+            try:
+                self.cache.set(file_path, self.text, details)
+            except:
+                pass
+        
+        return self.section_details
+    
+    def parse_many(self, paths: List[str], n_process: int = None,
+                   batch_size: int = 16) -> List[Dict[str, Any]]:
+        """
+        Parse several resumes in one call.
+        
+        Text extraction (PDF/DOCX decoding) is fanned out over a process
+        pool, and the extracted texts are run through spaCy with
+        ``nlp.pipe`` so skill extraction is batched instead of paying the
+        per-document pipeline overhead once per resume.
+        
+        Args:
+            paths: Resume file paths
+            n_process: Worker processes for ``nlp.pipe``; defaults to all
+                cores when there is more than one batch of documents
+            batch_size: Number of documents per spaCy batch
+            
+        Returns:
+            One dict per path with ``file_path``, ``text``, ``sections``
+            (as returned by ``parse_resume``) and ``skills``
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        self._result_cache.clear()
+        
+        if len(paths) > 1:
+            # No more workers than files, so small batches start few processes
+            workers = min(len(paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                texts = list(ex.map(_extract_file_text, paths))
+        else:
+            texts = [self._extract_any(paths[0])]
+        
+        parsed = []
+        for text in texts:
+            self.text = text
+            details = self._build_section_details()
+            self.sections = {sec: d['text'] for sec, d in details.items()}
+            parsed.append((details, self.sections, self._skills_text()))
+        
+        if self.nlp:
+            if n_process is None:
+                n_process = (os.cpu_count() or 1) if len(texts) > batch_size else 1
+            # get_skills only needs tokens, POS tags and the matcher
+            docs = self.nlp.pipe([p[2] for p in parsed], n_process=n_process,
+                                 batch_size=batch_size,
+                                 disable=['parser', 'ner', 'lemmatizer'])
+        else:
+            docs = [None] * len(texts)
+        
+        results = []
+        for path, text, (details, sections, _), doc in zip(paths, texts, parsed, docs):
+            self.text = text
+            self.sections = sections
+            self.section_details = details
+            results.append({
+                'file_path': path,
+                'text': text,
+                'sections': details,
+                'skills': self.get_skills(doc=doc)
+            })
+        # Don't leave the last resume behind for later get_* calls
+        self._reset_text()
+        return results
+    
+    def _build_section_details(self) -> Dict[str, Dict[str, Any]]:
+        """Split ``self.text`` into sections with their bullet points."""
         # Define section headers
         headers = {
             'contact': ['contact', 'contact information', 'personal information'],
@@ -191,24 +418,31 @@ class ResumeParser:
                 'bullet_points': bullets
             }
         
-        # Cache results
-        self.section_details = details
-        if file_path:
-            try:
-                self.cache.set(file_path, self.text, details)
-            except:
-                pass
-        
-        return self.section_details
+        return details
     
-    def get_skills(self) -> Dict[str, Dict[str, Any]]:
-        """Extract skills using NLP and pattern matching."""
-        skills = {}
-        
-        # Define skill recategorization rules
-        cloud_tools = {'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'ansible'}
-        
-        # Get text from relevant sections
+    def _memoize(self, name: str, source: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return ``compute()`` for ``source``, computing it at most once.
+        
+        The get_* extractors are pure functions of the section text they
+        read, so repeat calls for the same text (common when a caller asks
+        for several views of one resume) are served from the cache. Cached
+        results are shared between callers and must not be mutated.
+        """
+        key = (name, source)
+        try:
+            return self._result_cache[key]
+        except KeyError:
+            result = self._result_cache[key] = compute()
+            return result
+    
+    def _section_text(self, name: str) -> str:
+        """Return the text of a parsed section, or '' if absent."""
+        section = self.section_details.get(name)
+        return section.get('text', '') if isinstance(section, dict) else ''
+    
+    def _skills_text(self) -> str:
+        """Return the text skill extraction runs over."""
         combined_text = ""
         
         # Use sections from test input if available
@@ -220,6 +454,25 @@ class ResumeParser:
         # Otherwise use parser.text if available
         if not combined_text and self.text:
             combined_text = self.text
+        return combined_text
+    
+    def get_skills(self, doc=None) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract skills using NLP and pattern matching.
+        
+        Args:
+            doc: Optional pre-parsed spaCy Doc for the text being analyzed
+                (e.g. from ``nlp.pipe`` in ``parse_many``)
+        """
+        combined_text = self._skills_text()
+        return self._memoize('skills', combined_text,
+                             lambda: self._extract_skills(combined_text, doc))
+    
+    def _extract_skills(self, combined_text: str, doc=None) -> Dict[str, Dict[str, Any]]:
+        skills = {}
+        
+        # Define skill recategorization rules
+        cloud_tools = {'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'ansible'}
         
         # First, try to extract category: skill format (e.g., "Programming: Python, Java")
         # Pattern 1: Category followed by comma-separated skills on the same line
@@ -234,7 +487,7 @@ class ResumeParser:
                 continue
             
             # Split by commas to get individual skills
-            individual_skills = [s.strip() for s in re.split(r',|;|/', skills_text)]
+            individual_skills = [s.strip() for s in skills_text.translate(_DELIM_TO_COMMA).split(',')]
             for skill in individual_skills:
                 if skill and len(skill) > 1 and not skill.startswith('-'):
                     # Auto-categorize cloud tools
@@ -252,7 +505,8 @@ class ResumeParser:
         
         # Use spaCy for extraction (always try this for comprehensive results)
         if self.nlp and combined_text:
-            doc = self.nlp(combined_text)
+            if doc is None:
+                doc = self.nlp(combined_text)
             
             # Use PhraseMatcher for skill detection
             if self.matcher:
@@ -301,6 +555,10 @@ class ResumeParser:
     
     def get_contact_info(self) -> Dict[str, Any]:
         """Extract contact information."""
+        return self._memoize('contact', self.sections.get('contact', ''),
+                             self._extract_contact_info)
+    
+    def _extract_contact_info(self) -> Dict[str, Any]:
         info = {
             'name': None,
             'email': None,
@@ -315,31 +573,15 @@ class ResumeParser:
         
         text = self.sections['contact']
         
-        # Extract email
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        if email_match:
-            info['email'] = email_match.group()
-        
-        # Extract phone
-        phone_pattern = r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phone_match = re.search(phone_pattern, text)
-        if phone_match:
-            info['phone'] = phone_match.group()
-        
-        # Extract LinkedIn
-        linkedin_match = re.search(r'linkedin\.com/in/[\w\-]+', text)
-        if linkedin_match:
-            info['linkedin'] = linkedin_match.group()
-        
-        # Extract GitHub
-        github_match = re.search(r'github\.com/[\w\-]+', text)
-        if github_match:
-            info['github'] = github_match.group()
-        
-        # Extract location
-        location_match = re.search(r'[A-Z][a-zA-Z\s-]+,\s*[A-Z]{2}(?:\s*\d{5})?', text)
-        if location_match:
-            info['location'] = location_match.group()
+        # Single pass over the contact block; keep the first hit per field
+        remaining = len(_CONTACT_FIELDS)
+        for match in _CONTACT_RE.finditer(text):
+            field = match.lastgroup
+            if info[field] is None:
+                info[field] = match.group()
+                remaining -= 1
+                if not remaining:
+                    break
         
         # Extract name (first line)
         lines = text.split('\n')
@@ -377,6 +619,10 @@ class ResumeParser:
     
     def get_experience(self) -> List[Dict[str, Any]]:
         """Extract structured experience information."""
+        return self._memoize('experience', self._section_text('experience'),
+                             self._extract_experience)
+    
+    def _extract_experience(self) -> List[Dict[str, Any]]:
         experience = []
         
         if 'experience' not in self.section_details:
@@ -385,48 +631,32 @@ class ResumeParser:
         section = self.section_details['experience']
         text = section.get('text', '')
         
-        title_patterns = [
-            r'(?:senior|lead|principal|staff)?\s*(?:software|systems?|data)',
-            r'(?:engineer|developer|architect|scientist|analyst)',
-            r'(?:tech|engineering|development|product|program|project)',
-            r'(?:lead|manager|director|head|chief|vp|supervisor)',
-            r'(?:frontend|backend|full\s*stack|web|mobile)\s*developer'
-        ]
-        
-        date_patterns = [
-            r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
-            r'\d{4}-\d{2}',
-            r'\d{2}/\d{4}'
-        ]
-        
-        location_pattern = r'[A-Z][a-zA-Z\s-]+,\s*[A-Z]{2}(?:\s*\d{5})?'
-        
-        entries = []
+        # Each entry is kept as its list of stripped lines; joining happens
+        # only where a regex needs a single string.
+        entries: List[List[str]] = []
         current_entry = []
         
         for line in text.splitlines():
             line = line.strip()
             if not line:
                 if current_entry:
-                    entries.append('\n'.join(current_entry))
+                    entries.append(current_entry)
                     current_entry = []
                 continue
             
-            if (re.search(r'(?:19|20)\d{2}', line) and
-                (any(re.search(p, line, re.I) for p in title_patterns) or
-                 re.search(r'(?:@|at|\bat\b)\s+[A-Z][a-zA-Z0-9\s&\.,]+', line, re.I))):
+            if (_YEAR_RE.search(line) and
+                (any(p.search(line) for p in _TITLE_RES) or
+                 _AT_COMPANY_RE.search(line))):
                 if current_entry:
-                    entries.append('\n'.join(current_entry))
+                    entries.append(current_entry)
                     current_entry = []
             
             current_entry.append(line)
         
         if current_entry:
-            entries.append('\n'.join(current_entry))
+            entries.append(current_entry)
         
-        for entry in entries:
-            if not entry.strip():
-                continue
+        for lines in entries:
             
             job_info = {
                 'company': None,
@@ -440,43 +670,40 @@ class ResumeParser:
                 'impact': []
             }
             
-            lines = entry.split('\n')
-            header = ' '.join(line.strip() for line in lines[:2])
+            header = ' '.join(lines[:2])
             
             # Extract company
-            company_match = re.search(
-                r'(?:@|at|\bat\b)\s+([A-Z][a-zA-Z0-9\s&\.,]+)(?:,|\s|$)', 
-                header, re.I)
+            company_match = _COMPANY_RE.search(header)
             if company_match:
                 company_name = company_match.group(1).strip()
-                company_name = re.sub(r',\s*$', '', company_name)
+                company_name = _TRAILING_COMMA_RE.sub('', company_name)
                 job_info['company'] = company_name
             
             # Extract title - try to extract the full title before 'at'
-            title_part = re.split(r'\s+at\s+', header, flags=re.I)[0] if ' at ' in header.lower() else header
-            title_match = re.search(r'((?:senior|lead|principal|staff)\s+)?(?:software|data)\s+engineer', title_part, re.I)
+            title_part = _AT_SPLIT_RE.split(header)[0] if ' at ' in header.lower() else header
+            title_match = _ENGINEER_TITLE_RE.search(title_part)
             if title_match:
                 job_info['title'] = title_match.group(0).strip()
             else:
                 # Fallback to pattern matching
-                for pattern in title_patterns:
-                    title_match = re.search(pattern, header, re.I)
+                for pattern in _TITLE_RES:
+                    title_match = pattern.search(header)
                     if title_match:
                         job_info['title'] = title_match.group(0).strip().title()
                         break
             
             # Extract dates
-            if re.search(r'present|current|now', header, re.I):
+            if _PRESENT_RE.search(header):
                 dates = []
-                for pattern in date_patterns:
-                    dates.extend(re.findall(pattern, header))
+                for pattern in _DATE_RES:
+                    dates.extend(pattern.findall(header))
                 if dates:
                     job_info['start_date'] = dates[0]
                     job_info['end_date'] = 'Present'
             else:
                 dates = []
-                for pattern in date_patterns:
-                    dates.extend(re.findall(pattern, header))
+                for pattern in _DATE_RES:
+                    dates.extend(pattern.findall(header))
                 if len(dates) >= 2:
                     job_info['start_date'] = dates[0]
                     job_info['end_date'] = dates[1]
@@ -502,7 +729,7 @@ class ResumeParser:
             
             # Extract location
             location_text = header + '\n' + '\n'.join(lines[:3])
-            location_match = re.search(location_pattern, location_text)
+            location_match = _LOCATION_RE.search(location_text)
             if location_match:
                 job_info['location'] = location_match.group(0).strip()
             
@@ -517,10 +744,10 @@ class ResumeParser:
                 # Also categorize them
                 for bullet in bullets:
                     # Look for technology mentions
-                    if re.search(r'using|with|through|via|built\s+(?:with|using)', bullet, re.I):
+                    if _TECHNOLOGY_RE.search(bullet):
                         job_info['technologies'].append(bullet)
                     # Look for impact statements
-                    if re.search(r'increased|decreased|reduced|improved|achieved|won', bullet, re.I):
+                    if _IMPACT_RE.search(bullet):
                         job_info['impact'].append(bullet)
             
             if job_info['company'] or job_info['title']:
@@ -530,70 +757,43 @@ class ResumeParser:
     
     def get_education(self) -> List[Dict[str, str]]:
         """Extract structured education information."""
+        return self._memoize('education', self._section_text('education'),
+                             self._extract_education)
+    
+    def _extract_education(self) -> List[Dict[str, str]]:
         degrees = []
         
         if 'education' not in self.section_details:
             return degrees
         
-        degree_patterns = {
-            'bachelors': [
-                r"bachelor'?s?(?:\sof\s(?:science|arts|engineering|business))?",
-                r"b\.?(?:s|a|e|b\.?a)",
-                r"undergraduate degree",
-            ],
-            'masters': [
-                r"master'?s?(?:\sof\s(?:science|arts|engineering|business))?",
-                r"m\.?(?:s|a|e|b\.?a)",
-                r"graduate degree",
-            ],
-            'phd': [
-                r"ph\.?d",
-                r"doctor(?:ate)?\sof\sphilosophy",
-                r"doctoral degree",
-            ]
-        }
-        
-        major_patterns = [
-            r"(?:in|of)\s+([A-Za-z\s]+?)(?:\s*,|\s+Expected|\s+\d{4}|$)",  # "... in Computer Science, 2024"
-            r"([^,\.]+)\smajor",      # "Computer Science major"
-        ]
-        
-        # Compile patterns
-        degree_res = {
-            level: re.compile('|'.join(patterns), re.IGNORECASE)
-            for level, patterns in degree_patterns.items()
-        }
-        major_re = re.compile('|'.join(major_patterns), re.IGNORECASE)
-        
         section = self.section_details['education']
         text = section.get('text', '')
         
         # Split into entries
-        entries = []
+        entries: List[List[str]] = []
         current_entry = []
         
         for line in text.splitlines():
             line = line.strip()
             if not line:
                 if current_entry:
-                    entries.append('\n'.join(current_entry))
+                    entries.append(current_entry)
                     current_entry = []
                 continue
             
             if (len(line) > 5 and
-                not re.search(r'(?:19|20)\d{2}|gpa|bachelor|master|phd|degree', line, re.I)):
+                not _EDUCATION_DETAIL_RE.search(line)):
                 if current_entry:
-                    entries.append('\n'.join(current_entry))
+                    entries.append(current_entry)
                     current_entry = []
             
             current_entry.append(line)
         
         if current_entry:
-            entries.append('\n'.join(current_entry))
+            entries.append(current_entry)
         
-        for entry in entries:
-            if not entry.strip():
-                continue
+        for lines in entries:
+            entry = '\n'.join(lines)
             
             degree_info = {
                 'degree': None,
@@ -604,7 +804,7 @@ class ResumeParser:
             }
             
             # Extract degree
-            for level, pattern in degree_res.items():
+            for level, pattern in _DEGREE_RES.items():
                 if pattern.search(entry):
                     degree_info['degree'] = level.title()
                     break
@@ -612,32 +812,31 @@ class ResumeParser:
             # Extract major - try multiple patterns and pick the best match
             major_match = None
             # Try specific pattern first: "Bachelor of Science in Computer Science"
-            specific_match = re.search(r'(?:bachelor|master|doctor).*?\s+in\s+([A-Za-z\s]+?)(?:\s*,|\s+Expected|\s+\d{4}|$)', entry, re.I)
+            specific_match = _DEGREE_MAJOR_RE.search(entry)
             if specific_match:
                 major = specific_match.group(1).strip()
                 # Remove leading "Science in" or "Arts in" etc
-                major = re.sub(r'^(?:Science|Arts|Engineering|Business)\s+in\s+', '', major, flags=re.I)
+                major = _MAJOR_PREFIX_RE.sub('', major)
                 degree_info['major'] = major
             else:
                 # Fallback to general pattern
-                major_match = major_re.search(entry)
+                major_match = _MAJOR_RE.search(entry)
                 if major_match:
                     degree_info['major'] = major_match.group(1).strip()
             
             # Extract graduation
-            grad_match = re.search(r'(?:expected|anticipated)?\s*(?:19|20)\d{2}', entry, re.I)
+            grad_match = _GRADUATION_RE.search(entry)
             if grad_match:
                 degree_info['graduation'] = grad_match.group(0).strip()
             
             # Extract GPA
-            gpa_match = re.search(r'(?:gpa|grade point average)[:\s]+([0-9.]+)', entry, re.I)
+            gpa_match = _GPA_RE.search(entry)
             if gpa_match:
                 degree_info['gpa'] = gpa_match.group(1)
             
             # Extract school (first line)
-            lines = entry.split('\n')
             if lines:
-                first_line = lines[0].strip()
+                first_line = lines[0]
                 if (len(first_line) > 5 and
                     not any(word in first_line.lower() for word in 
                            ['gpa', 'expected', 'bachelor', 'master', 'phd'])):
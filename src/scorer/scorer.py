@@ -3,20 +3,169 @@ Module for scoring resume-job matching using TF-IDF and cosine similarity.
 """
 from typing import Dict, List, Tuple
 from collections import Counter
+import functools
 import math
+import re
 import numpy as np
-from sklearn.feature_extraction.text import CountVectorizer
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Try to import pyahocorasick, but make it optional
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Context keywords marking a job skill as critical or nice-to-have
+_CRIT_RE = re.compile(r'required|must|essential|necessary')
+_NICE_RE = re.compile(r'preferred|nice|plus|helpful|desirable')
+
+
+def _identity(terms):
+    """Analyzer for documents that were already split into n-grams."""
+    return terms
+
+
+def _sparse_cosine(ri, rd, ji, jd) -> float:
+    """
+    Cosine similarity of two sparse rows given as sorted indices and data.
+    
+    Walks both index arrays once, accumulating the dot product and both
+    squared norms in the same pass.
+    
+    Args:
+        ri: Sorted column indices of the first row
+        rd: Values of the first row
+        ji: Sorted column indices of the second row
+        jd: Values of the second row
+        
+    Returns:
+        Cosine similarity, or 0.0 if either row is all zeros
+    """
+    dot = 0.0
+    rnorm2 = 0.0
+    jnorm2 = 0.0
+    a = 0
+    b = 0
+    while a < len(ri) and b < len(ji):
+        if ri[a] == ji[b]:
+            dot += rd[a] * jd[b]
+            rnorm2 += rd[a] * rd[a]
+            jnorm2 += jd[b] * jd[b]
+            a += 1
+            b += 1
+        elif ri[a] < ji[b]:
+            rnorm2 += rd[a] * rd[a]
+            a += 1
+        else:
+            jnorm2 += jd[b] * jd[b]
+            b += 1
+    while a < len(ri):
+        rnorm2 += rd[a] * rd[a]
+        a += 1
+    while b < len(ji):
+        jnorm2 += jd[b] * jd[b]
+        b += 1
+    
+    if rnorm2 == 0.0 or jnorm2 == 0.0:
+        return 0.0
+    return dot / (math.sqrt(rnorm2) * math.sqrt(jnorm2))
+
+
+def _first_occurrences(text: str, patterns: List[str]) -> Dict[str, int]:
+    """
+    Find the earliest offset of each pattern in text.
+    
+    With pyahocorasick available all patterns are matched in a single pass
+    over the text; otherwise each pattern is located with str.find.
+    
+    Args:
+        text: Text to search
+        patterns: Non-empty patterns to locate
+        
+    Returns:
+        Dictionary mapping each pattern found to its first start offset
+    """
+    first = {}
+    if HAS_AHOCORASICK and patterns:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        # Matches arrive in order of end offset, so the first hit for a
+        # pattern is also its earliest start
+        for end, pattern in automaton.iter(text):
+            if pattern not in first:
+                first[pattern] = end - len(pattern) + 1
+        return first
+    
+    for pattern in patterns:
+        idx = text.find(pattern)
+        if idx >= 0:
+            first[pattern] = idx
+    return first
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze(text: str) -> Tuple[str, ...]:
+    """
+    Split text into the scorer's n-grams, memoized per text.
+    
+    The same job description is usually scored against many resumes, so
+    its n-grams are only computed once.
+    
+    Args:
+        text: Document text
+        
+    Returns:
+        Tuple of unigrams and bigrams with English stop words removed
+    """
+    return tuple(ResumeScorer.ANALYZER(text))
+
+
+if HAS_NUMBA:
+    _sparse_cosine = njit(cache=True, fastmath=True)(_sparse_cosine)
+    # Compile at import so no request pays the JIT cost
+    _sparse_cosine(
+        np.zeros(1, dtype=np.int32), np.ones(1, dtype=np.float32),
+        np.zeros(1, dtype=np.int32), np.ones(1, dtype=np.float32)
+    )
+
 
 class ResumeScorer:
     """Score resumes against job descriptions using NLP techniques."""
     
+    # The analyzer and hashing vectorizer hold no per-document state, so
+    # they are built once and shared by every scorer instance. Each
+    # document is tokenised once; both the hashed similarity vectors and
+    # the named term counts are built from the same n-gram lists
+    ANALYZER = CountVectorizer(
+        stop_words='english',
+        ngram_range=(1, 2)  # Include both unigrams and bigrams
+    ).build_analyzer()
+    # Hashing needs no fitted vocabulary and L2-normalises each row,
+    # so cosine similarity is a single sparse dot product
+    VECTORIZER = HashingVectorizer(
+        analyzer=_identity,
+        n_features=2**14,
+        alternate_sign=False,
+        norm='l2',
+        dtype=np.float32  # Unit-length rows need no double precision
+    )
+    
     def __init__(self):
         """Initialize the resume scorer."""
-        self.vectorizer = CountVectorizer(
-            stop_words='english',
-            max_features=5000,
-            ngram_range=(1, 2)  # Include both unigrams and bigrams
-        )
+        self.vectorizer = self.VECTORIZER
+        self._texts = None
+        self._terms = None
         self.resume_vector = None
         self.job_vector = None
         self.feature_names = None
@@ -32,36 +181,101 @@ class ResumeScorer:
         Returns:
             Similarity score between 0 and 1
         """
-        # Create count matrix for both texts
-        texts = [resume_text, job_text]
-        try:
-            count_matrix = self.vectorizer.fit_transform(texts)
-            self.feature_names = self.vectorizer.get_feature_names_out()
-        except ValueError:
-            # Empty vocabulary (e.g., documents only contain stop words)
-            # Set empty vectors and feature names so downstream callers
-            # can handle missing features gracefully.
-            self.feature_names = []
-            self.resume_vector = []
-            self.job_vector = []
+        self._texts = [resume_text, job_text]
+        self._terms = None
+        # Term count vectors are only built if important terms or the
+        # skills gap are requested
+        self.resume_vector = None
+        self.job_vector = None
+        self.feature_names = None
+        
+        # Nothing to compare against
+        if not resume_text.strip() or not job_text.strip():
             return 0.0
         
-        # Store vectors for feature importance analysis and convert to arrays
-        self.resume_vector = count_matrix[0].toarray()[0]
-        self.job_vector = count_matrix[1].toarray()[0]
+        resume_terms = _analyze(resume_text)
+        if resume_text == job_text:
+            # Identical documents match fully unless they had no terms
+            self._terms = [resume_terms, resume_terms]
+            return 1.0 if resume_terms else 0.0
+        self._terms = [resume_terms, _analyze(job_text)]
         
-        # Calculate cosine similarity manually
-        dot_product = np.dot(self.resume_vector, self.job_vector)
-        resume_norm = np.linalg.norm(self.resume_vector)
-        job_norm = np.linalg.norm(self.job_vector)
+        # Rows are unit length, so a document with no terms has a zero row
+        # and the dot product is 0
+        hashed = self.vectorizer.transform(self._terms)
+        hashed.sort_indices()
+        resume_row = hashed.getrow(0)
+        job_row = hashed.getrow(1)
+        if HAS_NUMBA:
+            similarity = _sparse_cosine(
+                resume_row.indices, resume_row.data,
+                job_row.indices, job_row.data
+            )
+        else:
+            similarity = resume_row.multiply(job_row).sum()
         
-        # Avoid division by zero
-        if resume_norm == 0 or job_norm == 0:
-            return 0.0
+        # float32 rounding can put near-identical documents a hair above 1
+        return min(float(similarity), 1.0)
+    
+    def compute_similarity_batch(self, resume_texts: List[str], job_text: str) -> List[float]:
+        """
+        Compute similarity scores of several resumes against one job description.
+        
+        The job description is hashed once and every resume is scored with a
+        single sparse matrix product. Unlike compute_similarity, no state is
+        kept for get_important_terms.
+        
+        Args:
+            resume_texts: Full texts of the resumes
+            job_text: Full text of the job description
             
-        similarity = dot_product / (resume_norm * job_norm)
+        Returns:
+            Similarity scores between 0 and 1, in the order of resume_texts
+        """
+        if not job_text.strip():
+            return [0.0] * len(resume_texts)
+        if not resume_texts:
+            return []
         
-        return float(similarity)
+        job_terms = _analyze(job_text)
+        resume_terms = [_analyze(text) if text.strip() else () for text in resume_texts]
+        hashed = self.vectorizer.transform([job_terms] + resume_terms)
+        scores = (hashed[1:] @ hashed[0].T).toarray().ravel()
+        
+        # Identical documents match fully unless they had no terms, as in
+        # compute_similarity
+        full_match = 1.0 if job_terms else 0.0
+        return [
+            full_match if text == job_text else min(float(score), 1.0)
+            for text, score in zip(resume_texts, scores)
+        ]
+    
+    def _build_term_vectors(self) -> None:
+        """Build named term count rows for the last compared documents."""
+        if self.feature_names is not None:
+            return
+        if self._terms is None:
+            self._terms = [_analyze(text) for text in self._texts]
+        
+        counter = CountVectorizer(analyzer=_identity, max_features=5000, dtype=np.int32)
+        try:
+            count_matrix = counter.fit_transform(self._terms)
+        except ValueError:
+            # Empty vocabulary (e.g., documents only contain stop words)
+            # Set empty vectors and feature names so downstream callers
+            # can handle missing features gracefully.
+            self.feature_names = np.array([], dtype=object)
+            self.resume_vector = csr_matrix((1, 0))
+            self.job_vector = csr_matrix((1, 0))
+            return
+        
+        # Keep the rows sparse: each document only has a few hundred
+        # non-zero n-grams out of the whole vocabulary. Sorting the indices
+        # keeps term iteration in vocabulary order.
+        count_matrix.sort_indices()
+        self.resume_vector = count_matrix.getrow(0)
+        self.job_vector = count_matrix.getrow(1)
+        self.feature_names = counter.get_feature_names_out()
     
     def get_important_terms(self, n_terms: int = 10) -> Dict[str, List[str]]:
         """
@@ -73,27 +287,50 @@ class ResumeScorer:
         Returns:
             Dictionary with important terms from resume and job
         """
-        if self.resume_vector is None or self.job_vector is None:
+        if self._texts is None:
             raise ValueError("Must compute similarity first")
+        self._build_term_vectors()
 
         # If feature names are empty (e.g. vectorizer had empty vocabulary),
         # return empty term lists rather than raising or indexing errors.
         if getattr(self, 'feature_names', None) is None or len(self.feature_names) == 0:
             return {'resume_terms': [], 'job_terms': []}
         
-        # Get top terms from resume
-        resume_idx = np.argsort(self.resume_vector)[::-1]
-        resume_terms = [self.feature_names[i] for i in resume_idx[:n_terms]]
-        
-        # Get top terms from job description
-        job_idx = np.argsort(self.job_vector)[::-1]
-        job_terms = [self.feature_names[i] for i in job_idx[:n_terms]]
-        
         return {
-            'resume_terms': resume_terms,
-            'job_terms': job_terms
+            'resume_terms': self._top_terms(self.resume_vector, n_terms),
+            'job_terms': self._top_terms(self.job_vector, n_terms)
         }
     
+    def _top_terms(self, vector, n_terms: int) -> List[str]:
+        """
+        Get the names of the highest-count terms in a term row.
+        
+        Args:
+            vector: Sparse term count row
+            n_terms: Number of terms to return
+            
+        Returns:
+            Term names ordered by descending count
+        """
+        # Rank only the row's non-zero entries, not the whole vocabulary.
+        # Find the n-th largest count in linear time and only sort the
+        # entries at or above it.
+        counts = vector.data
+        if 0 < n_terms < counts.size:
+            threshold = np.partition(counts, -n_terms)[-n_terms]
+            top = np.flatnonzero(counts >= threshold)
+        else:
+            top = np.arange(counts.size)
+        # Highest count first; ties go to the later vocabulary entry
+        top = top[np.lexsort((-vector.indices[top], -counts[top]))]
+        top = vector.indices[top[:n_terms]]
+        
+        # Fill up with zero-count terms when the document has fewer terms
+        if len(top) < n_terms:
+            zero = np.setdiff1d(np.arange(len(self.feature_names)), vector.indices)
+            top = np.concatenate([top, zero[::-1][:n_terms - len(top)]])
+        return self.feature_names[top].tolist()
+    
     def get_skills_gap_analysis(self, resume_text: str, job_text: str) -> Dict[str, Dict[str, List[str]]]:
         """
         Perform detailed skills gap analysis between resume and job requirements.
@@ -117,45 +354,48 @@ class ResumeScorer:
         if not resume_text.strip() or not job_text.strip():
             return empty_result
             
-        # Extract skills using vectorizer
-        if not hasattr(self, 'feature_names') or self.feature_names is None:
-            try:
-                self.compute_similarity(resume_text, job_text)
-            except ValueError:
-                return empty_result
+        # Extract skills using vectorizer, reusing the last comparison only
+        # if it was for these same texts
+        if self._texts != [resume_text, job_text]:
+            self.compute_similarity(resume_text, job_text)
+        self._build_term_vectors()
             
-        # Get skill frequencies
-        resume_skills = {
-            self.feature_names[i]: self.resume_vector[i]
-            for i in range(len(self.feature_names))
-            if self.resume_vector[i] > 0
-        }
+        # Get skill frequencies from the stored (non-zero) entries of each row
+        resume_skills = dict(zip(
+            self.feature_names[self.resume_vector.indices].tolist(),
+            self.resume_vector.data.tolist()
+        ))
         
-        job_skills = {
-            self.feature_names[i]: self.job_vector[i]
-            for i in range(len(self.feature_names))
-            if self.job_vector[i] > 0
-        }
+        job_skills = dict(zip(
+            self.feature_names[self.job_vector.indices].tolist(),
+            self.job_vector.data.tolist()
+        ))
         
         # Identify critical vs nice-to-have skills based on frequency and keywords
-        critical_indicators = {'required', 'must', 'essential', 'necessary'}
-        nice_to_have_indicators = {'preferred', 'nice', 'plus', 'helpful', 'desirable'}
-        
         critical_skills = []
         nice_to_have_skills = []
         
+        # Computed once rather than per skill
+        job_text_lower = job_text.lower()
+        resume_lc = {s.lower() for s in resume_skills}
+        job_lc = {s.lower() for s in job_skills}
+        mean_freq = np.mean(list(job_skills.values())) if job_skills else 0.0
+        
+        # Locate every job skill in the job text up front
+        skill_offsets = _first_occurrences(job_text_lower, list(job_lc))
+        
         for skill, freq in job_skills.items():
             # Check surrounding context in job text to determine importance
-            skill_idx = job_text.lower().find(skill.lower())
+            skill_idx = skill_offsets.get(skill.lower(), -1)
             if skill_idx >= 0:
-                context = job_text[max(0, skill_idx-50):min(len(job_text), skill_idx+50)].lower()
-                if any(ind in context for ind in critical_indicators):
+                context = job_text_lower[max(0, skill_idx-50):min(len(job_text), skill_idx+50)]
+                if _CRIT_RE.search(context):
                     critical_skills.append(skill)
-                elif any(ind in context for ind in nice_to_have_indicators):
+                elif _NICE_RE.search(context):
                     nice_to_have_skills.append(skill)
                 else:
                     # If no explicit indicator, use frequency as a proxy
-                    if freq > np.mean(list(job_skills.values())):
+                    if freq > mean_freq:
                         critical_skills.append(skill)
                     else:
                         nice_to_have_skills.append(skill)
@@ -163,23 +403,23 @@ class ResumeScorer:
         # Find gaps
         critical_missing = [
             skill for skill in critical_skills
-            if skill.lower() not in {s.lower() for s in resume_skills.keys()}
+            if skill.lower() not in resume_lc
         ]
         
         nice_to_have_missing = [
             skill for skill in nice_to_have_skills
-            if skill.lower() not in {s.lower() for s in resume_skills.keys()}
+            if skill.lower() not in resume_lc
         ]
         
         # Find matched and additional skills
         matched_skills = [
             skill for skill in resume_skills
-            if skill.lower() in {s.lower() for s in job_skills.keys()}
+            if skill.lower() in job_lc
         ]
         
         additional_skills = [
             skill for skill in resume_skills
-            if skill.lower() not in {s.lower() for s in job_skills.keys()}
+            if skill.lower() not in job_lc
         ]
         
         return {
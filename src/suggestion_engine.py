@@ -5,6 +5,18 @@ from typing import Dict, List, Optional
 import re
 from collections import Counter
 
+# Patterns used by analyze_section
+_QUANT_RE = re.compile(r'\d+%|\d+x|\$\d+|\d+ \w+')
+# A '•' bullet line that does not open with one of the listed action verbs.
+# Indented bullets always count, as the verb check only applies to bullets
+# at the start of the line. [^\S\n] keeps matches within a single line.
+_WEAK_BULLET_RE = re.compile(
+    r'^(?:[^\S\n]+•|•(?![^\S\n]*(?:Led|Developed|Implemented|Created|Managed|Improved)))',
+    re.MULTILINE
+)
+_WORD_RE = re.compile(r'\b\w+\b')
+_YEARS_RE = re.compile(r'\d+ years?')
+
 class SuggestionEngine:
     """Generate targeted suggestions for improving resume sections."""
     
@@ -28,6 +40,19 @@ class SuggestionEngine:
             'summary': r'summary|objective|profile|about',
         }
         
+        # Exact header lookup and a single fuzzy matcher built from the
+        # tables above. Each fuzzy alternative is a lookahead tried from the
+        # start of the line in section order, so the first section whose
+        # pattern occurs anywhere in the line wins, as with a search loop.
+        self._header_to_section = {}
+        for section, headers in self.section_headers.items():
+            for header in headers:
+                self._header_to_section.setdefault(header, section)
+        self._combined_pattern = re.compile('|'.join(
+            f'(?=.*?(?:{pattern}))(?P<{section}>)'
+            for section, pattern in self.section_patterns.items()
+        ), re.DOTALL)
+        
         self.section_requirements = {
             'education': [
                 'degree name',
@@ -71,6 +96,12 @@ class SuggestionEngine:
                 'unique value proposition'
             ]
         }
+        
+        # Lower-cased keywords for each requirement, split once
+        self._requirement_tokens = {
+            section: [_WORD_RE.findall(req.lower()) for req in reqs]
+            for section, reqs in self.section_requirements.items()
+        }
     
     def identify_sections(self, text: str) -> Dict[str, str]:
         """
@@ -83,45 +114,54 @@ class SuggestionEngine:
             Dictionary mapping section names to their content
         """
         sections = {}
-        lines = text.split('\n')
-        current_section = None
-        current_content = []
-        
-        # Remove leading/trailing whitespace from entire text
-        text = '\n'.join(line for line in lines)
-        sections_text = [section.strip() for section in text.split('\n\n') if section.strip()]
-        
-        # Process each potential section
-        for section_text in sections_text:
-            lines = section_text.split('\n')
-            first_line = lines[0].strip().lower()
-            content_lines = [line.strip() for line in lines[1:] if line.strip()]
-            
-            # Identify section type from first line
-            section_type = None
+        
+        # Process each blank-line separated block; only lines of blocks
+        # whose first line names a section are split and stripped
+        for section_text in text.split('\n\n'):
+            section_text = section_text.strip()
+            if not section_text:
+                continue
+            first_line, _, rest = section_text.partition('\n')
+            first_line = first_line.strip().lower()
             
-            # Check exact matches first
-            for section, headers in self.section_headers.items():
-                if any(header == first_line for header in headers):
-                    section_type = section
-                    break
-                    
-            # Then try pattern matches
+            # Identify section type from first line: exact matches first,
+            # then pattern matches
+            section_type = self._header_to_section.get(first_line)
+            if not section_type:
+                match = self._combined_pattern.match(first_line)
+                if match:
+                    section_type = match.lastgroup
             if not section_type:
-                for section, pattern in self.section_patterns.items():
-                    if re.search(pattern, first_line):
-                        section_type = section
-                        break
+                continue
             
             # If we found a section type and have content, add it
-            if section_type and content_lines:
-                sections[section_type] = '\n'.join(content_lines)        # Save last section
-        if current_section and current_content:
-            sections[current_section] = '\n'.join(current_content)
-            
+            content_lines = [line.strip() for line in rest.split('\n') if line.strip()]
+            if content_lines:
+                sections[section_type] = '\n'.join(content_lines)
+        
         return sections
     
-    def analyze_section(self, section: str, content: str, job_requirements: str) -> List[str]:
+    def _job_context(self, job_requirements: str) -> Dict:
+        """
+        Tokenise a job description once for reuse across sections.
+        
+        Args:
+            job_requirements: The job description requirements
+            
+        Returns:
+            Dictionary with the lower-cased text, its word set and the five
+            most common words
+        """
+        lower = job_requirements.lower()
+        words = _WORD_RE.findall(lower)
+        return {
+            'lower': lower,
+            'tokens': set(words),
+            'top5': {word for word, count in Counter(words).most_common(5)}
+        }
+    
+    def analyze_section(self, section: str, content: str, job_requirements: str,
+                        job_ctx: Optional[Dict] = None) -> List[str]:
         """
         Analyze a resume section and generate improvement suggestions.
         
@@ -129,35 +169,40 @@ class SuggestionEngine:
             section: The name of the section (education, experience, etc.)
             content: The content of the section
             job_requirements: The job description requirements
+            job_ctx: Optional precomputed result of _job_context for
+                job_requirements
             
         Returns:
             List of suggestions for improving the section
         """
+        if job_ctx is None:
+            job_ctx = self._job_context(job_requirements)
         suggestions = []
         requirements = self.section_requirements.get(section, [])
+        req_tokens = self._requirement_tokens.get(section, [])
+        content_lower = content.lower()
+        # Words in the section, tokenised once for all checks below
+        content_tokens = set(_WORD_RE.findall(content_lower))
         
         # Check for missing required elements
-        for req in requirements:
-            if not any(keyword in content.lower() for keyword in req.lower().split()):
+        for req, keywords in zip(requirements, req_tokens):
+            if not any(keyword in content_tokens for keyword in keywords):
                 suggestions.append(f"Add {req} to your {section} section")
         
         # Section-specific analysis
         if section == 'experience':
             # Check for quantifiable achievements
-            if not re.search(r'\d+%|\d+x|\$\d+|\d+ \w+', content):
+            if not _QUANT_RE.search(content):
                 suggestions.append("Add quantifiable achievements (e.g., increased efficiency by 25%, managed $1M budget)")
                 
             # Check for action verbs at the start of bullets
-            lines = content.split('\n')
-            for line in lines:
-                if line.strip().startswith('•') and not re.match(r'•\s*(Led|Developed|Implemented|Created|Managed|Improved)', line):
-                    suggestions.append("Start bullet points with strong action verbs (e.g., Led, Developed, Implemented)")
-                    break
+            if _WEAK_BULLET_RE.search(content):
+                suggestions.append("Start bullet points with strong action verbs (e.g., Led, Developed, Implemented)")
         
         elif section == 'skills':
             # Extract skills from job requirements
-            job_skills = set(re.findall(r'\b\w+\b', job_requirements.lower()))
-            content_skills = set(re.findall(r'\b\w+\b', content.lower()))
+            job_skills = job_ctx['tokens']
+            content_skills = content_tokens
             
             # Find important skills from job that are missing
             important_missing = job_skills - content_skills
@@ -166,22 +211,21 @@ class SuggestionEngine:
         
         elif section == 'education':
             # Check for GPA if mentioned in job
-            if 'gpa' in job_requirements.lower() and 'gpa' not in content.lower():
+            if 'gpa' in job_ctx['lower'] and 'gpa' not in content_lower:
                 suggestions.append("Include GPA if it's 3.0 or higher")
                 
             # Check for relevant coursework
-            if 'coursework' not in content.lower():
+            if 'coursework' not in content_lower:
                 suggestions.append("List relevant coursework that aligns with job requirements")
         
         elif section == 'summary':
             # Check for years of experience
-            if not re.search(r'\d+ years?', content):
+            if not _YEARS_RE.search(content):
                 suggestions.append("Mention your years of experience in the summary")
                 
             # Check for alignment with job requirements
-            job_keywords = Counter(re.findall(r'\b\w+\b', job_requirements.lower()))
-            most_common_job_reqs = {word for word, count in job_keywords.most_common(5)}
-            summary_words = set(re.findall(r'\b\w+\b', content.lower()))
+            most_common_job_reqs = job_ctx['top5']
+            summary_words = content_tokens
             
             missing_key_terms = most_common_job_reqs - summary_words
             if missing_key_terms:
@@ -202,9 +246,11 @@ class SuggestionEngine:
         """
         sections = self.identify_sections(resume_text)
         suggestions = {}
+        # The job description is the same for every section
+        job_ctx = self._job_context(job_description)
         
         for section, content in sections.items():
-            section_suggestions = self.analyze_section(section, content, job_description)
+            section_suggestions = self.analyze_section(section, content, job_description, job_ctx)
             if section_suggestions:
                 suggestions[section] = section_suggestions
                 
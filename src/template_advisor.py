@@ -1,66 +1,177 @@
 """Resume template and formatting recommendations."""
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+import re
+import numpy as np
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # ATS-friendly templates and best practices
 TEMPLATE_RECOMMENDATIONS = {
     'modern_professional': {
         'name': 'Modern Professional',
         'description': 'Clean, ATS-friendly format with clear sections',
-        'features': [
+        'features': (
             'Single column layout for better ATS parsing',
             'Clear section headers (Experience, Education, Skills)',
             'Standard fonts (Arial, Calibri, Times New Roman)',
             'Bullet points for achievements',
             '0.5-1 inch margins',
             'No tables, text boxes, or graphics that confuse ATS'
-        ],
-        'recommended_for': ['Technical roles', 'Corporate positions', 'Entry to mid-level'],
+        ),
+        'recommended_for': ('Technical roles', 'Corporate positions', 'Entry to mid-level'),
         'ats_score': 95
     },
     'executive': {
         'name': 'Executive',
         'description': 'Leadership-focused format highlighting strategic achievements',
-        'features': [
+        'features': (
             'Executive summary at the top',
             'Emphasis on leadership and business impact',
             'Quantified achievements with metrics',
             'Board positions and speaking engagements',
             'Professional affiliations',
             'Two-page format acceptable'
-        ],
-        'recommended_for': ['C-suite', 'Senior management', '15+ years experience'],
+        ),
+        'recommended_for': ('C-suite', 'Senior management', '15+ years experience'),
         'ats_score': 90
     },
     'technical': {
         'name': 'Technical/Developer',
         'description': 'Skills-first format for technical professionals',
-        'features': [
+        'features': (
             'Technical skills section prominently placed',
             'Project highlights with technologies used',
             'GitHub/Portfolio links',
             'Certifications and technical training',
             'Clear technology stack for each role',
             'Keywords aligned with job descriptions'
-        ],
-        'recommended_for': ['Software engineers', 'IT professionals', 'Data scientists'],
+        ),
+        'recommended_for': ('Software engineers', 'IT professionals', 'Data scientists'),
         'ats_score': 92
     },
     'creative': {
         'name': 'Creative Professional',
         'description': 'Portfolio-focused with personality (use carefully)',
-        'features': [
+        'features': (
             'Portfolio link prominently displayed',
             'Skills and tools section',
             'Project-based experience format',
             'Minimal color accents (if any)',
             'Still ATS-compatible formatting',
             'Links to work samples'
-        ],
-        'recommended_for': ['Designers', 'Writers', 'Marketing professionals'],
+        ),
+        'recommended_for': ('Designers', 'Writers', 'Marketing professionals'),
         'ats_score': 85
     }
 }
 
+# Job type keywords, checked in priority order from the start of the text so
+# an executive keyword anywhere wins over a technical one, and so on. The
+# group that matched names the template.
+_JOB_TYPE_RE = re.compile(
+    r'(?=.*?(?:chief|director|vp|vice president|head of|executive))(?P<executive>)'
+    r'|(?=.*?(?:engineer|developer|programmer|software|data scientist|devops))(?P<technical>)'
+    r'|(?=.*?(?:designer|creative|writer|artist|marketing|brand))(?P<creative>)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Personalized advice by similarity tier
+_ADVICE_BY_TIER = {
+    'low': (
+        'Restructure resume to emphasize skills matching the job description',
+        'Use keywords from the job posting throughout your resume',
+        'Quantify achievements relevant to this role'
+    ),
+    'medium': (
+        'Good match! Fine-tune keywords to improve ATS compatibility',
+        'Add more specific examples of relevant experience'
+    ),
+    'high': (
+        'Excellent match! Maintain current keyword usage',
+        'Ensure formatting is ATS-friendly for submission'
+    )
+}
+
+# Every template/tier combination and each template's alternatives are
+# fixed, so they are built once here; callers must treat them as read-only
+_PRECOMPUTED_TEMPLATES = {
+    (key, tier): {**template, 'priority_advice': advice}
+    for key, template in TEMPLATE_RECOMMENDATIONS.items()
+    for tier, advice in _ADVICE_BY_TIER.items()
+}
+_ALTERNATIVES = {
+    key: [TEMPLATE_RECOMMENDATIONS[k] for k in TEMPLATE_RECOMMENDATIONS if k != key][:2]
+    for key in TEMPLATE_RECOMMENDATIONS
+}
+
+# Character checks for text the numba scan does not handle
+_DIGIT_RE = re.compile(r'\d')
+_TABLE_CHARS_RE = re.compile(r'[|┃]')
+
+# Common section names anywhere in the text, in any case. The lookahead lets
+# overlapping names such as "experienceducation" both match.
+_SECTIONS_RE = re.compile(r'(?=(experience|education|skills))', re.IGNORECASE)
+
+
+def _scan_ascii(data) -> Tuple[int, bool, bool]:
+    """
+    Count words and detect digits and pipes in ASCII text in one pass.
+    
+    Args:
+        data: ASCII text as a uint8 array
+    
+    Returns:
+        Tuple of (word_count, has_digit, has_pipe)
+    """
+    word_count = 0
+    has_digit = False
+    has_pipe = False
+    in_word = False
+    for b in data:
+        # ASCII characters that str.split() treats as whitespace
+        if b == 32 or 9 <= b <= 13 or 28 <= b <= 31:
+            in_word = False
+        else:
+            if not in_word:
+                word_count += 1
+                in_word = True
+            if 48 <= b <= 57:
+                has_digit = True
+            elif b == 124:
+                has_pipe = True
+    return word_count, has_digit, has_pipe
+
+
+if HAS_NUMBA:
+    _scan_ascii = njit(cache=True)(_scan_ascii)
+    # Compile at import so no request pays the JIT cost
+    _scan_ascii(np.frombuffer(b'warm up 1|', dtype=np.uint8))
+
+
+def _scan_text(resume_text: str) -> Tuple[int, bool, bool]:
+    """
+    Get the word count and whether the text has digits or table characters.
+    
+    Args:
+        resume_text: Full text of the resume
+    
+    Returns:
+        Tuple of (word_count, has_numbers, has_table_chars)
+    """
+    if HAS_NUMBA and resume_text.isascii():
+        return _scan_ascii(np.frombuffer(resume_text.encode('ascii'), dtype=np.uint8))
+    
+    return (
+        len(resume_text.split()),
+        _DIGIT_RE.search(resume_text) is not None,
+        _TABLE_CHARS_RE.search(resume_text) is not None
+    )
+
 def analyze_resume_format(resume_text: str, contact_info: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyze resume format and provide improvement suggestions.
@@ -87,8 +198,9 @@ def analyze_resume_format(resume_text: str, contact_info: Dict[str, Any]) -> Dic
         suggestions.append('Include a phone number for easy contact')
         score -= 5
     
+    word_count, has_numbers, has_table_chars = _scan_text(resume_text)
+    
     # Check resume length (rough estimate)
-    word_count = len(resume_text.split())
     if word_count < 200:
         issues.append('Resume appears too short')
         suggestions.append('Expand on your experience and achievements (aim for 400-800 words)')
@@ -100,22 +212,29 @@ def analyze_resume_format(resume_text: str, contact_info: Dict[str, Any]) -> Dic
     
     # Check for action verbs (already done in verb enhancement)
     # Check for quantifiable achievements
-    has_numbers = any(char.isdigit() for char in resume_text)
     if not has_numbers:
         issues.append('No quantifiable achievements found')
         suggestions.append('Add metrics and numbers (e.g., "Increased sales by 25%", "Managed team of 10")')
         score -= 15
     
     # Check for common ATS-unfriendly elements (basic text analysis)
-    if '|' in resume_text or '┃' in resume_text:
+    if has_table_chars:
         issues.append('May contain tables or columns that confuse ATS')
         suggestions.append('Use simple bullet points instead of tables or multi-column layouts')
         score -= 10
     
     # Check for appropriate section headers
     common_sections = ['experience', 'education', 'skills']
-    lower_text = resume_text.lower()
-    missing_sections = [s for s in common_sections if s not in lower_text]
+    found = set()
+    for match in _SECTIONS_RE.finditer(resume_text):
+        # IGNORECASE also matches Unicode variants such as 'ſkills', which
+        # lower() does not fold to a section name
+        name = match.group(1).lower()
+        if name in common_sections:
+            found.add(name)
+        if len(found) == len(common_sections):
+            break
+    missing_sections = [s for s in common_sections if s not in found]
     
     if missing_sections:
         issues.append(f'Missing common sections: {", ".join(missing_sections)}')
@@ -157,57 +276,21 @@ def get_template_recommendation(
     Returns:
         Recommended template with explanation
     """
-    job_lower = job_description.lower()
-    
     # Detect job type
-    is_technical = any(keyword in job_lower for keyword in [
-        'engineer', 'developer', 'programmer', 'software', 'data scientist', 'devops'
-    ])
-    
-    is_executive = any(keyword in job_lower for keyword in [
-        'chief', 'director', 'vp', 'vice president', 'head of', 'executive'
-    ])
-    
-    is_creative = any(keyword in job_lower for keyword in [
-        'designer', 'creative', 'writer', 'artist', 'marketing', 'brand'
-    ])
-    
-    # Recommend template
-    if is_executive:
-        template_key = 'executive'
-    elif is_technical:
-        template_key = 'technical'
-    elif is_creative:
-        template_key = 'creative'
-    else:
-        template_key = 'modern_professional'
-    
-    template = TEMPLATE_RECOMMENDATIONS[template_key].copy()
+    match = _JOB_TYPE_RE.match(job_description)
+    template_key = match.lastgroup if match else 'modern_professional'
     
     # Add personalized advice
     if similarity_score < 60:
-        template['priority_advice'] = [
-            'Restructure resume to emphasize skills matching the job description',
-            'Use keywords from the job posting throughout your resume',
-            'Quantify achievements relevant to this role'
-        ]
+        tier = 'low'
     elif similarity_score < 80:
-        template['priority_advice'] = [
-            'Good match! Fine-tune keywords to improve ATS compatibility',
-            'Add more specific examples of relevant experience'
-        ]
+        tier = 'medium'
     else:
-        template['priority_advice'] = [
-            'Excellent match! Maintain current keyword usage',
-            'Ensure formatting is ATS-friendly for submission'
-        ]
+        tier = 'high'
     
     return {
-        'recommended_template': template,
-        'alternative_templates': [
-            TEMPLATE_RECOMMENDATIONS[k] for k in TEMPLATE_RECOMMENDATIONS.keys()
-            if k != template_key
-        ][:2]  # Show 2 alternatives
+        'recommended_template': _PRECOMPUTED_TEMPLATES[(template_key, tier)],
+        'alternative_templates': _ALTERNATIVES[template_key]  # Show 2 alternatives
     }
 
 def get_ats_tips() -> List[str]:
@@ -1,6 +1,7 @@
 """Validation utilities for request input and file handling."""
 import os
-from typing import Dict, Tuple, Optional
+from tempfile import SpooledTemporaryFile
+from typing import AbstractSet, Dict, Tuple, Optional
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
@@ -8,7 +9,7 @@ class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
-def validate_file_upload(file: FileStorage, field_name: str, allowed_extensions: set) -> Tuple[str, str]:
+def validate_file_upload(file: FileStorage, field_name: str, allowed_extensions: AbstractSet[str]) -> Tuple[str, str]:
     """
     Validate a file upload and return the secure filename and file extension.
     
@@ -30,10 +31,11 @@ def validate_file_upload(file: FileStorage, field_name: str, allowed_extensions:
         raise ValidationError(f"No {field_name} file selected")
     
     # Get the file extension
-    if '.' not in file.filename:
+    _, dot, extension = file.filename.rpartition('.')
+    if not dot:
         raise ValidationError(f"{field_name} must have a file extension")
     
-    extension = file.filename.rsplit('.', 1)[1].lower()
+    extension = extension.lower()
     if extension not in allowed_extensions:
         raise ValidationError(
             f"Invalid file type for {field_name}. Allowed types: {', '.join(allowed_extensions)}"
@@ -52,16 +54,46 @@ def validate_file_size(file: FileStorage, max_size_mb: int) -> None:
     Raises:
         ValidationError: If file is too large
     """
-    # Read file content length
-    file.seek(0, os.SEEK_END)
-    size = file.tell()
-    file.seek(0)  # Reset file pointer
-    
     max_size_bytes = max_size_mb * 1024 * 1024
+    error = f"File size exceeds maximum allowed size of {max_size_mb}MB"
+    
+    # The part's Content-Length is supplied by the client (browsers usually
+    # omit it), so it can only reject a file early; an accepted file is
+    # still measured
+    declared = getattr(file, 'content_length', 0) or 0
+    if declared > max_size_bytes:
+        raise ValidationError(error)
+    
+    size = _stream_file_size(getattr(file, 'stream', None))
+    if size == 0:
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        file.seek(0)  # Reset file pointer
+    
     if size > max_size_bytes:
-        raise ValidationError(
-            f"File size exceeds maximum allowed size of {max_size_mb}MB"
-        )
+        raise ValidationError(error)
+
+def _stream_file_size(stream) -> int:
+    """
+    Get the size of a stream backed by an OS file with a single fstat call.
+    
+    Args:
+        stream: The upload's underlying stream
+        
+    Returns:
+        Size in bytes, or 0 if the stream has no file descriptor
+    """
+    # Werkzeug spools uploads in memory until they pass 500KB; asking a
+    # spooled file still in memory for its descriptor would force it onto
+    # disk, so those are left to seek/tell
+    if stream is None:
+        return 0
+    if isinstance(stream, SpooledTemporaryFile) and not getattr(stream, '_rolled', False):
+        return 0
+    try:
+        return os.fstat(stream.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return 0
 
 def error_response(message: str, details: Optional[Dict] = None, status_code: int = 400) -> Tuple[Dict, int]:
     """
@@ -1,77 +1,215 @@
 """
 Module for suggesting stronger action verbs in resume bullet points.
 """
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import re
 import spacy
 
+# Try to import pyahocorasick, but make it optional
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Bullet, numbered and lettered list markers, then the fallbacks. One
+# alternation tried in that order; the named group that matched holds the
+# bullet text, so no marker is stripped separately.
+_MARKER_RE = re.compile(
+    r'^\s*(?:'
+    # broaden the set of recognized bullet characters (common bullets and a few rarer variants)
+    r'[\u2022\u2023\u2043\u00B7\u2E21\-\*\u25CB\u25AA\u25E6\u2192]\s+(?P<bullet>.*)'
+    r'|\d+[\.)]\s+(?P<numbered>.*)'
+    r'|[a-zA-Z]\)\s+(?P<letter>.*)'
+    # fallback: a line starting with dashes/asterisks
+    r'|[-*]+\s*(?P<dash>.*)'
+    # last-resort: any non-alphanumeric single char bullet
+    r'|[^A-Za-z0-9\s]\s+(?P<other>.*)'
+    r')$'
+)
+
+# Particles and prepositions that extract_leading_verb may attach to the
+# verb ("Led with"); a strong verb followed by one of these is left to the
+# parse
+_VERB_PARTICLES = frozenset({
+    'about', 'across', 'after', 'against', 'along', 'among', 'around', 'as',
+    'at', 'away', 'back', 'before', 'behind', 'between', 'beyond', 'by',
+    'down', 'during', 'for', 'forward', 'from', 'in', 'into', 'like', 'of',
+    'off', 'on', 'onto', 'out', 'over', 'past', 'per', 'through',
+    'throughout', 'to', 'toward', 'towards', 'under', 'up', 'upon', 'via',
+    'with', 'within', 'without'
+})
+
+# Verb categories and their impact levels
+ACTION_VERBS = {
+    'leadership': {
+        'strong': frozenset({
+            'led', 'spearheaded', 'directed', 'orchestrated', 'championed',
+            'mentored', 'managed', 'guided', 'initiated', 'established'
+        }),
+        'weak': frozenset({
+            'helped', 'assisted', 'participated', 'supported', 'worked on',
+            'was responsible for', 'handled', 'dealt with'
+        })
+    },
+    'achievement': {
+        'strong': frozenset({
+            'achieved', 'delivered', 'exceeded', 'outperformed', 'generated',
+            'increased', 'improved', 'reduced', 'accelerated', 'maximized'
+        }),
+        'weak': frozenset({
+            'completed', 'finished', 'did', 'made', 'met goals',
+            'worked toward', 'tried to', 'attempted'
+        })
+    },
+    'technical': {
+        'strong': frozenset({
+            'engineered', 'architected', 'designed', 'developed', 'implemented',
+            'optimized', 'refactored', 'streamlined', 'integrated', 'automated'
+        }),
+        'weak': frozenset({
+            'coded', 'programmed', 'wrote', 'typed', 'entered',
+            'used', 'utilized', 'employed'
+        })
+    },
+    'communication': {
+        'strong': frozenset({
+            'presented', 'negotiated', 'influenced', 'persuaded', 'mediated',
+            'collaborated', 'partnered', 'facilitated', 'trained', 'educated'
+        }),
+        'weak': frozenset({
+            'talked', 'spoke', 'told', 'said', 'attended',
+            'met with', 'participated in', 'was involved in'
+        })
+    },
+    'analytical': {
+        'strong': frozenset({
+            'analyzed', 'assessed', 'evaluated', 'researched', 'investigated',
+            'identified', 'formulated', 'calculated', 'measured', 'forecasted'
+        }),
+        'weak': frozenset({
+            'looked at', 'reviewed', 'thought about', 'considered',
+            'checked', 'watched', 'observed', 'noticed'
+        })
+    }
+}
+
+# Weak verb -> the first three strong verbs of its category, alphabetically,
+# so suggestions are the same on every run. The weak verbs of a category
+# share one tuple.
+VERB_IMPROVEMENTS: Dict[str, Tuple[str, ...]] = {
+    weak: strongest
+    for verbs in ACTION_VERBS.values()
+    for strongest in [tuple(sorted(verbs['strong'])[:3])]
+    for weak in verbs['weak']
+}
+
+class VerbAnalysis(NamedTuple):
+    """Compact, immutable enhancement result for one bullet point."""
+    original: str
+    has_verb: bool
+    verb: Optional[str] = None
+    verb_position: Optional[Tuple[int, int]] = None
+    categories: Tuple[str, ...] = ()
+    strength: Optional[str] = None
+    suggestions: Optional[Tuple[str, ...]] = None
+    examples: Optional[Tuple[str, ...]] = None
+    
+    def to_dict(self) -> Dict[str, any]:
+        """
+        Convert to the result dictionary returned by the enhancer.
+        
+        Returns:
+            Dictionary with only the keys that apply to this result
+        """
+        if not self.has_verb:
+            return {
+                'original': self.original,
+                'has_verb': False,
+                'suggestion': 'Start with a strong action verb'
+            }
+        result = {'original': self.original, 'has_verb': True, 'verb': self.verb}
+        if self.verb_position is None:
+            # Uncategorized verb
+            result.update(strength=self.strength, categories=[], suggestions=self.suggestions)
+            return result
+        result['verb_position'] = self.verb_position
+        result['categories'] = list(self.categories)
+        result['strength'] = self.strength
+        if self.suggestions is not None:
+            result['suggestions'] = self.suggestions
+        if self.examples is not None:
+            result['examples'] = list(self.examples)
+        return result
+
 class ActionVerbEnhancer:
     """Suggest stronger action verbs for resume bullet points."""
     
     def __init__(self):
         """Initialize the action verb enhancer with verb databases."""
-        self.nlp = spacy.load('en_core_web_sm')
-        
-        # Define verb categories and their impact levels
-        self.action_verbs = {
-            'leadership': {
-                'strong': {
-                    'led', 'spearheaded', 'directed', 'orchestrated', 'championed',
-                    'mentored', 'managed', 'guided', 'initiated', 'established'
-                },
-                'weak': {
-                    'helped', 'assisted', 'participated', 'supported', 'worked on',
-                    'was responsible for', 'handled', 'dealt with'
-                }
-            },
-            'achievement': {
-                'strong': {
-                    'achieved', 'delivered', 'exceeded', 'outperformed', 'generated',
-                    'increased', 'improved', 'reduced', 'accelerated', 'maximized'
-                },
-                'weak': {
-                    'completed', 'finished', 'did', 'made', 'met goals',
-                    'worked toward', 'tried to', 'attempted'
-                }
-            },
-            'technical': {
-                'strong': {
-                    'engineered', 'architected', 'designed', 'developed', 'implemented',
-                    'optimized', 'refactored', 'streamlined', 'integrated', 'automated'
-                },
-                'weak': {
-                    'coded', 'programmed', 'wrote', 'typed', 'entered',
-                    'used', 'utilized', 'employed'
-                }
-            },
-            'communication': {
-                'strong': {
-                    'presented', 'negotiated', 'influenced', 'persuaded', 'mediated',
-                    'collaborated', 'partnered', 'facilitated', 'trained', 'educated'
-                },
-                'weak': {
-                    'talked', 'spoke', 'told', 'said', 'attended',
-                    'met with', 'participated in', 'was involved in'
-                }
-            },
-            'analytical': {
-                'strong': {
-                    'analyzed', 'assessed', 'evaluated', 'researched', 'investigated',
-                    'identified', 'formulated', 'calculated', 'measured', 'forecasted'
-                },
-                'weak': {
-                    'looked at', 'reviewed', 'thought about', 'considered',
-                    'checked', 'watched', 'observed', 'noticed'
-                }
-            }
-        }
+        # Only the tagger, attribute ruler (coarse POS tags) and parser are
+        # used, so skip entity recognition and lemmatization
+        self.nlp = spacy.load('en_core_web_sm', disable=['ner', 'lemmatizer'])
         
-        # Create mapping of weak to strong verbs
-        self.verb_improvements = {}
+        # Verb databases are shared by every instance
+        self.action_verbs = ACTION_VERBS
+        self.verb_improvements = VERB_IMPROVEMENTS
+        
+        # Enhancement results keyed by bullet text; resumes often repeat
+        # phrasing, so identical bullets are only analyzed once
+        self._enhance_cache: Dict[str, VerbAnalysis] = {}
+        # Categories and suggestions per lower-cased verb; the partial
+        # matching behind them only runs the first time a verb is seen
+        self._category_cache: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        self._suggestion_cache: Dict[str, Tuple[str, ...]] = {}
+        
+        self._build_verb_index()
+    
+    def _build_verb_index(self) -> None:
+        """Precompute the lookups used by categorize_verb."""
+        # Exact matches: verb -> {category: strength}
+        self._verb_index: Dict[str, Dict[str, str]] = {}
+        # Partial matches per category. A verb is part of a listed verb if
+        # it occurs in the newline-joined list, and contains a listed verb
+        # if the escaped alternation finds it.
+        self._verb_matchers = []
+        # Multi-word weak verbs in one case-insensitive pattern, longest
+        # first, so a single search finds the earliest one in a bullet
+        multiword = sorted(
+            (verb for verbs in self.action_verbs.values() for verb in verbs['weak'] if ' ' in verb),
+            key=lambda verb: (-len(verb), verb)
+        )
+        self._multiword_weak_re = re.compile('|'.join(map(re.escape, multiword)), re.IGNORECASE)
+        # Strong verbs of every category, for the parse-free fast path
+        self._all_strong = frozenset(
+            verb for verbs in self.action_verbs.values() for verb in verbs['strong']
+        )
         for category, verbs in self.action_verbs.items():
-            for weak in verbs['weak']:
-                # For each weak verb, suggest top 3 strong verbs from same category
-                self.verb_improvements[weak] = list(verbs['strong'])[:3]
+            # Strong verbs last so they win over a weak entry
+            for strength in ('weak', 'strong'):
+                for verb in verbs[strength]:
+                    self._verb_index.setdefault(verb, {})[category] = strength
+            self._verb_matchers.append((
+                category,
+                '\n'.join(verbs['strong']),
+                re.compile('|'.join(map(re.escape, verbs['strong']))),
+                '\n'.join(verbs['weak']),
+                re.compile('|'.join(map(re.escape, verbs['weak'])))
+            ))
+        
+        # With pyahocorasick, one automaton over every listed verb finds all
+        # the verbs contained in a word in a single pass
+        self._verb_automaton = None
+        if HAS_AHOCORASICK:
+            hits: Dict[str, List[Tuple[str, str]]] = {}
+            for category, verbs in self.action_verbs.items():
+                for strength in ('strong', 'weak'):
+                    for verb in verbs[strength]:
+                        hits.setdefault(verb, []).append((category, strength))
+            self._verb_automaton = ahocorasick.Automaton()
+            for verb, verb_hits in hits.items():
+                self._verb_automaton.add_word(verb, verb_hits)
+            self._verb_automaton.make_automaton()
     
     def identify_bullet_points(self, text: str) -> List[str]:
         """
@@ -83,74 +221,48 @@ class ActionVerbEnhancer:
         Returns:
             List of bullet point text strings
         """
-        bullet_points: List[str] = []
-
         if not text:
-            return bullet_points
+            return []
 
         # Line-based extraction is simpler and less error-prone than trying
         # multiple overlapping regexes. Detect common bullet markers and
-        # normalized numbered/lettered lists.
-        # broaden the set of recognized bullet characters (common bullets and a few rarer variants)
-        bullet_re = re.compile(r'^\s*[\u2022\u2023\u2043\u00B7\u2E21\-\*\u25CB\u25AA\u25E6\u2192]\s+(.*)$')
-        numbered_re = re.compile(r'^\s*(\d+)[\.)]\s+(.*)$')
-        letter_re = re.compile(r'^\s*([a-zA-Z])\)\s+(.*)$')
-
-        seen = set()
+        # normalized numbered/lettered lists. Keys of an insertion-ordered
+        # dict keep the first occurrence of each bullet.
+        bullet_points: Dict[str, None] = {}
         for raw_line in text.splitlines():
             line = raw_line.rstrip()
             if not line.strip():
                 continue
 
-            m = bullet_re.match(line)
-            if m:
-                candidate = m.group(1).strip()
-            else:
-                m = numbered_re.match(line)
-                if m:
-                    candidate = m.group(2).strip()
-                else:
-                    m = letter_re.match(line)
-                    if m:
-                        candidate = m.group(2).strip()
-                    else:
-                        # fallback: if the line looks like a bullet because it
-                        # starts with a dash/asterisk or contains a leading bullet char
-                        stripped = line.strip()
-                        if stripped.startswith(('-', '*')):
-                            candidate = stripped.lstrip('-*').strip()
-                        else:
-                            # last-resort: match any non-alphanumeric single char bullet
-                            m2 = re.match(r'^\s*([^A-Za-z0-9\s])\s+(.*)$', line)
-                            if m2:
-                                candidate = m2.group(2).strip()
-                            else:
-                                # not a bullet-like line
-                                continue
+            m = _MARKER_RE.match(line)
+            if not m:
+                # not a bullet-like line
+                continue
 
-            if candidate and candidate not in seen:
-                bullet_points.append(candidate)
-                seen.add(candidate)
+            candidate = m.group(m.lastgroup).strip()
+            if candidate:
+                bullet_points[candidate] = None
 
-        return bullet_points
+        return list(bullet_points)
     
-    def extract_leading_verb(self, text: str) -> Tuple[str, int, int]:
+    def extract_leading_verb(self, text: str, doc=None) -> Tuple[str, int, int]:
         """
         Extract the leading verb from a bullet point.
         
         Args:
             text: Bullet point text
+            doc: Optional spaCy Doc already parsed from text
             
         Returns:
             Tuple of (verb, start_index, end_index) or (None, -1, -1) if no verb found
         """
-        doc = self.nlp(text)
-        
         # Look for multi-word weak verbs first
-        for weak_verb in [v for verbs in self.action_verbs.values() for v in verbs['weak']]:
-            if ' ' in weak_verb and weak_verb.lower() in text.lower():
-                start = text.lower().index(weak_verb.lower())
-                return (text[start:start + len(weak_verb)], start, start + len(weak_verb))
+        multiword = self._find_multiword_weak(text)
+        if multiword:
+            return multiword
+        
+        if doc is None:
+            doc = self.nlp(text)
         
         # Then look for the first verb token
         for token in doc:
@@ -167,6 +279,50 @@ class ActionVerbEnhancer:
         
         return (None, -1, -1)
     
+    def _find_multiword_weak(self, text: str):
+        """
+        Find the earliest listed multi-word weak verb in text.
+        
+        Args:
+            text: Bullet point text
+            
+        Returns:
+            Tuple of (verb, start_index, end_index), or None if there is none
+        """
+        match = self._multiword_weak_re.search(text)
+        if match:
+            return (match.group(), match.start(), match.end())
+        return None
+    
+    def _strong_lead(self, bullet: str):
+        """
+        Find a listed strong verb opening a bullet point without parsing it.
+        
+        A bullet holding a multi-word weak verb, or whose verb is followed
+        by a particle or preposition, is left to extract_leading_verb, which
+        reports the multi-word verb or the verb phrase.
+        
+        Args:
+            bullet: Bullet point text
+            
+        Returns:
+            Tuple of (verb, start_index, end_index), or None if the bullet
+            does not open with a strong verb
+        """
+        words = bullet.split(None, 2)
+        if not words:
+            return None
+        first = words[0].rstrip(',.;:')
+        if first.lower() not in self._all_strong or self._find_multiword_weak(bullet):
+            return None
+        # Punctuation after the verb ends the phrase; otherwise the parse
+        # may extend the verb with the next word
+        if (first == words[0] and len(words) > 1
+                and words[1].rstrip(',.;:').lower() in _VERB_PARTICLES):
+            return None
+        start = len(bullet) - len(bullet.lstrip())
+        return (first, start, start + len(first))
+    
     def categorize_verb(self, verb: str) -> List[Tuple[str, str]]:
         """
         Categorize a verb and determine its strength.
@@ -179,29 +335,47 @@ class ActionVerbEnhancer:
         """
         if not verb:
             return []
-        
-        verb_lower = verb.lower()
+        return self._categorize_lower(verb.lower())
+    
+    def _categorize_lower(self, verb_lower: str) -> List[Tuple[str, str]]:
+        """categorize_verb for a verb that is already non-empty and lower-cased."""
+        categories = self._category_cache.get(verb_lower)
+        if categories is None:
+            if len(self._category_cache) >= 4096:
+                self._category_cache.clear()
+            categories = self._category_cache[verb_lower] = tuple(self._match_categories(verb_lower))
+        return list(categories)
+    
+    def _match_categories(self, verb_lower: str) -> List[Tuple[str, str]]:
+        """Look up the categories of a lower-cased verb, including partial matches."""
+        exact = self._verb_index.get(verb_lower, {})
         categories = []
+        if self._verb_automaton is None:
+            contained = None
+        else:
+            contained = {
+                hit for _, verb_hits in self._verb_automaton.iter(verb_lower)
+                for hit in verb_hits
+            }
         
-        for category, verbs in self.action_verbs.items():
-            if verb_lower in verbs['strong']:
-                categories.append((category, 'strong'))
-            elif verb_lower in verbs['weak']:
-                categories.append((category, 'weak'))
+        for category, strong_text, strong_re, weak_text, weak_re in self._verb_matchers:
+            if category in exact:
+                categories.append((category, exact[category]))
             # Also check if verb is part of a multi-word phrase
+            elif contained is not None:
+                if verb_lower in strong_text or (category, 'strong') in contained:
+                    categories.append((category, 'strong'))
+                if verb_lower in weak_text or (category, 'weak') in contained:
+                    categories.append((category, 'weak'))
             else:
-                for strong_verb in verbs['strong']:
-                    if verb_lower in strong_verb or strong_verb in verb_lower:
-                        categories.append((category, 'strong'))
-                        break
-                for weak_verb in verbs['weak']:
-                    if verb_lower in weak_verb or weak_verb in verb_lower:
-                        categories.append((category, 'weak'))
-                        break
+                if verb_lower in strong_text or strong_re.search(verb_lower):
+                    categories.append((category, 'strong'))
+                if verb_lower in weak_text or weak_re.search(verb_lower):
+                    categories.append((category, 'weak'))
         
         return categories
     
-    def suggest_stronger_verbs(self, verb: str) -> List[str]:
+    def suggest_stronger_verbs(self, verb: str) -> Tuple[str, ...]:
         """
         Suggest stronger alternatives for a weak verb.
         
@@ -209,97 +383,140 @@ class ActionVerbEnhancer:
             verb: Verb to find alternatives for
             
         Returns:
-            List of suggested stronger verbs
+            Tuple of suggested stronger verbs
         """
-        verb_lower = verb.lower()
-        
+        return self._suggest_lower(verb.lower())
+    
+    def _suggest_lower(self, verb_lower: str) -> Tuple[str, ...]:
+        """suggest_stronger_verbs for a verb that is already lower-cased."""
         # Direct lookup in improvements dictionary
         if verb_lower in self.verb_improvements:
             return self.verb_improvements[verb_lower]
         
-        # Look for partial matches
-        suggestions = []
-        for weak_verb, improvements in self.verb_improvements.items():
-            if verb_lower in weak_verb or weak_verb in verb_lower:
-                suggestions.extend(improvements)
-        
-        return list(set(suggestions))  # Remove duplicates
+        suggestions = self._suggestion_cache.get(verb_lower)
+        if suggestions is None:
+            if len(self._suggestion_cache) >= 4096:
+                self._suggestion_cache.clear()
+            # Look for partial matches
+            matches = []
+            for weak_verb, improvements in self.verb_improvements.items():
+                if verb_lower in weak_verb or weak_verb in verb_lower:
+                    matches.extend(improvements)
+            # Remove duplicates, keep order
+            suggestions = self._suggestion_cache[verb_lower] = tuple(dict.fromkeys(matches))
+        return suggestions
     
-    def enhance_bullet_point(self, bullet: str) -> Dict[str, any]:
+    def enhance_bullet_point(self, bullet: str, doc=None) -> Dict[str, any]:
         """
         Analyze and enhance a single bullet point.
         
         Args:
             bullet: Text of the bullet point
+            doc: Optional spaCy Doc already parsed from bullet
             
         Returns:
             Dictionary containing analysis and suggestions
         """
-        # Extract the leading verb
-        verb, start, end = self.extract_leading_verb(bullet)
+        if bullet not in self._enhance_cache:
+            self._cache_enhancement(bullet, doc)
+        # Cached results are immutable; callers get a fresh dictionary
+        return self._enhance_cache[bullet].to_dict()
+    
+    def _cache_enhancement(self, bullet: str, doc=None) -> None:
+        """Analyze a bullet point and store the result in the cache."""
+        if len(self._enhance_cache) >= 4096:
+            self._enhance_cache.clear()
+        self._enhance_cache[bullet] = self._analyze_bullet_point(bullet, doc)
+    
+    def _analyze_bullet_point(self, bullet: str, doc=None) -> VerbAnalysis:
+        """Build the enhancement result for a single bullet point."""
+        # Extract the leading verb, skipping the parse for bullets that
+        # open with a strong verb
+        verb, start, end = self._strong_lead(bullet) or self.extract_leading_verb(bullet, doc)
         if not verb:
-            return {
-                'original': bullet,
-                'has_verb': False,
-                'suggestion': 'Start with a strong action verb'
-            }
+            return VerbAnalysis(bullet, False)
         
-        # Analyze the verb
-        categories = self.categorize_verb(verb)
+        # Analyze the verb, lower-cased once for every lookup below
+        verb_lower = verb.lower()
+        categories = self._categorize_lower(verb_lower)
         
         # If no categories found, verb might be uncategorized
         if not categories:
-            return {
-                'original': bullet,
-                'has_verb': True,
-                'verb': verb,
-                'strength': 'unknown',
-                'categories': [],
-                'suggestions': self.suggest_stronger_verbs(verb)
-            }
+            return VerbAnalysis(
+                bullet, True, verb,
+                strength='unknown',
+                suggestions=self._suggest_lower(verb_lower)
+            )
         
         # Check if any category considers this a weak verb
         is_weak = any(strength == 'weak' for _, strength in categories)
         
-        result = {
-            'original': bullet,
-            'has_verb': True,
-            'verb': verb,
-            'verb_position': (start, end),
-            'categories': [cat for cat, _ in categories],
-            'strength': 'weak' if is_weak else 'strong'
-        }
-        
         # Add suggestions if the verb is weak
+        suggestions = examples = None
         if is_weak:
-            suggestions = self.suggest_stronger_verbs(verb)
+            suggestions = self._suggest_lower(verb_lower) or None
             if suggestions:
-                result['suggestions'] = suggestions
-                
-                # Create example replacements
-                examples = []
-                verb_with_space = bullet[start:end + 1]  # Include following space
-                for suggestion in suggestions[:2]:  # Limit to top 2 suggestions
-                    new_bullet = bullet[:start] + suggestion + bullet[end:]
-                    examples.append(new_bullet)
-                
-                if examples:
-                    result['examples'] = examples
+                # Create example replacements, limited to top 2 suggestions
+                examples = tuple(
+                    bullet[:start] + suggestion + bullet[end:]
+                    for suggestion in suggestions[:2]
+                )
         
-        return result
+        return VerbAnalysis(
+            bullet, True, verb,
+            verb_position=(start, end),
+            categories=tuple(cat for cat, _ in categories),
+            strength='weak' if is_weak else 'strong',
+            suggestions=suggestions,
+            examples=examples
+        )
     
-    def enhance_bullet_points(self, text: str) -> List[Dict[str, any]]:
+    def enhance_bullet_points(self, text: str, n_process: int = 1) -> List[Dict[str, any]]:
         """
         Analyze and enhance all bullet points in text.
         
         Args:
             text: Resume text containing bullet points
+            n_process: Worker processes for parsing large batches
             
         Returns:
             List of enhancement suggestions for each bullet point
         """
         bullet_points = self.identify_bullet_points(text)
-        return [self.enhance_bullet_point(bullet) for bullet in bullet_points]
+        return self.enhance_bullet_points_batch(bullet_points, n_process=n_process)
+    
+    def enhance_bullet_points_batch(self, bullets: List[str],
+                                    n_process: int = 1) -> List[Dict[str, any]]:
+        """
+        Analyze and enhance a list of bullet points, parsing them in batches.
+        
+        Args:
+            bullets: Bullet point texts
+            n_process: Worker processes for parsing large batches. Each
+                worker loads its own copy of the model, so only offline
+                callers should raise it; request handlers keep the default.
+            
+        Returns:
+            List of enhancement suggestions for each bullet point
+        """
+        # Only parse bullets that have not been analyzed before and do not
+        # open with a strong verb
+        pending = []
+        for bullet in dict.fromkeys(bullets):
+            if bullet in self._enhance_cache:
+                continue
+            if self._strong_lead(bullet):
+                self._cache_enhancement(bullet)
+            else:
+                pending.append(bullet)
+        # Only spread large batches over worker processes; for a handful of
+        # bullets the cost of starting the workers outweighs the gain
+        if len(pending) <= 32:
+            n_process = 1
+        docs = self.nlp.pipe(pending, batch_size=64, n_process=n_process)
+        for bullet, doc in zip(pending, docs):
+            self._cache_enhancement(bullet, doc)
+        return [self.enhance_bullet_point(bullet) for bullet in bullets]
     
     def summarize_enhancements(self, enhancements: List[Dict[str, any]]) -> Dict[str, any]:
         """
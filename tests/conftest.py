@@ -0,0 +1,169 @@
+"""Shared pytest fixtures."""
+import functools
+import importlib.metadata
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# The NLP tests only check coarse entity labels and skill tokens, which the
+# small English model handles, so default to it even if the parser's default
+# changes. Set before any test module imports the parser.
+os.environ.setdefault('RESUME_PARSER_SPACY_MODEL', 'en_core_web_sm')
+
+# Keep NLP libraries from probing model hubs over the network during tests
+os.environ.setdefault('HF_HUB_OFFLINE', '1')
+os.environ.setdefault('TRANSFORMERS_OFFLINE', '1')
+
+# Pipeline components the parser tests never read. The attribute ruler stays
+# on because the small model sets token.pos_ through it.
+UNUSED_PIPES = ('parser', 'lemmatizer')
+
+
+def _trimmed_model(config, model):
+    """
+    Save a copy of a spaCy model without UNUSED_PIPES to the pytest cache.
+    
+    The copy is written once per model version by the main process and
+    reused by later runs and xdist workers, so parser tests never load the
+    unused components' weights.
+    
+    Args:
+        config: The pytest config
+        model: Name of the installed model package
+        
+    Returns:
+        Path of the trimmed model, or None if there is no cache to hold it
+        or it has not been written yet
+    """
+    cache = getattr(config, 'cache', None)
+    if cache is None:
+        return None
+    version = importlib.metadata.version(model)
+    path = cache.mkdir(f'{model}-{version}-trimmed')
+    if not (path / 'config.cfg').exists():
+        if hasattr(config, 'workerinput'):
+            return None
+        import spacy
+        nlp = spacy.load(model)
+        for name in UNUSED_PIPES:
+            if name in nlp.pipe_names:
+                nlp.remove_pipe(name)
+        nlp.to_disk(path)
+    return str(path)
+
+
+def pytest_configure(config):
+    """Check the spaCy model the parser tests load and trim it for them."""
+    model = os.environ['RESUME_PARSER_SPACY_MODEL']
+    if os.path.isdir(model):
+        # Already pointed at a model directory, e.g. by the main process
+        return
+    if importlib.util.find_spec(model) is None:
+        config.issue_config_time_warning(pytest.PytestConfigWarning(
+            f"spaCy model '{model}' is not installed; NLP tests will fail. "
+            f"Run: python -m spacy download {model}"
+        ), stacklevel=2)
+        return
+    trimmed = _trimmed_model(config, model)
+    if trimmed:
+        os.environ['RESUME_PARSER_SPACY_MODEL'] = trimmed
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--runslow', action='store_true', default=False,
+        help='run tests marked as slow'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption('--runslow'):
+        return
+    skip_slow = pytest.mark.skip(reason='needs --runslow option to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _disable_unused_pipes(nlp):
+    """Disable the UNUSED_PIPES components a loaded pipeline has."""
+    if not nlp:
+        return
+    unused = [name for name in UNUSED_PIPES if name in nlp.pipe_names]
+    try:
+        nlp.select_pipes(disable=unused)
+    except ValueError:
+        pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def lean_parser_pipeline():
+    """
+    Disable unused spaCy components in every ResumeParser the tests build.
+    
+    Only parser modules already imported by the collected tests are
+    patched, so running e.g. just the scorer tests never imports spaCy.
+    """
+    def wrap(init):
+        @functools.wraps(init)
+        def __init__(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+            _disable_unused_pipes(self.nlp)
+        return __init__
+
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ('resume_parser.parser', 'src.resume_parser.parser'):
+            module = sys.modules.get(name)
+            if module is not None:
+                mp.setattr(module.ResumeParser, '__init__', wrap(module.ResumeParser.__init__))
+        yield
+
+
+@pytest.fixture(scope="session")
+def shared_parser():
+    """Create one ResumeParser so the spaCy pipeline loads only once."""
+    from resume_parser.parser import ResumeParser
+    parser = ResumeParser()
+    _disable_unused_pipes(parser.nlp)
+    return parser
+
+
+@pytest.fixture
+def parser(shared_parser):
+    """The shared parser with the previous test's resume state cleared."""
+    shared_parser._reset_text()
+    return shared_parser
+
+
+@pytest.fixture(scope="session")
+def minimal_pdf_bytes():
+    """Bytes of a minimal, structurally valid one-page PDF."""
+    return (
+        b'%PDF-1.4\n'
+        b'1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n'
+        b'2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n'
+        b'3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n'
+        b'xref\n0 4\n0000000000 65535 f\n\n'
+        b'trailer<</Size 4/Root 1 0 R>>\n'
+        b'startxref\n0\n%%EOF\n'
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _parse(nlp, text):
+    return nlp(text)
+
+
+@pytest.fixture(scope="session")
+def cached_doc():
+    """
+    Parse text with a spaCy pipeline, reusing the Doc for repeated text.
+    
+    Returns:
+        Function taking (nlp, text) and returning the parsed Doc. Docs are
+        shared between tests and must not be modified.
+    """
+    return _parse
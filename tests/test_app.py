@@ -2,7 +2,8 @@
 import os
 import pytest
 from io import BytesIO
-from src.app import app
+from unittest.mock import MagicMock
+from src.app import app, limiter
 from src.resume_parser.parser import ResumeParser
 from src.scorer.scorer import ResumeScorer
 
@@ -10,12 +11,72 @@ def create_test_file(filename='test.pdf', content=b'test content'):
     """Create a test file for upload."""
     return (BytesIO(content), filename)
 
-@pytest.fixture
+# App settings for these tests: CSRF disabled, and PDF structure
+# validation skipped
+TEST_CONFIG_OVERRIDES = {
+    'WTF_CSRF_ENABLED': False,
+    'TESTING': True,
+    'VALIDATE_PDF': False
+}
+
+# Canned parser and scorer results for the full upload test
+MOCK_RESUME_TEXT = "Sample resume text with skills like Python and Java"
+MOCK_PARSED_RESUME = {
+    'summary': {
+        'text': 'Sample professional summary',
+        'bullet_points': []
+    },
+    'experience': {
+        'text': 'Sample work experience',
+        'bullet_points': ['Led development team', 'Improved processes']
+    },
+    'education': {
+        'text': 'Sample education details',
+        'bullet_points': []
+    },
+    'skills': {
+        'text': 'Python, Java, and other skills',
+        'bullet_points': ['Python', 'Java']
+    }
+}
+MOCK_SKILLS = {'Python': 1, 'Java': 1}
+MOCK_CONTACT_INFO = {
+    'email': 'test@example.com',
+    'phone': '123-456-7890',
+    'linkedin': None,
+    'github': None
+}
+MOCK_SIMILARITY = 0.75
+MOCK_IMPORTANT_TERMS = {
+    'resume_terms': ['Python', 'Java'],
+    'job_terms': ['Python', 'Java']
+}
+MOCK_FEEDBACK = {
+    'match_percentage': 0.75,
+    'missing_skills': [],
+    'overall_feedback': 'Good match',
+    'suggestions': [],
+    'key_terms': ['Python', 'Java']
+}
+
+@pytest.fixture(scope="module", autouse=True)
+def app_config():
+    """Apply the test settings once per module and restore them afterwards."""
+    saved = {key: app.config[key] for key in TEST_CONFIG_OVERRIDES if key in app.config}
+    app.config.update(TEST_CONFIG_OVERRIDES)
+    yield
+    for key in TEST_CONFIG_OVERRIDES:
+        app.config.pop(key, None)
+    app.config.update(saved)
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start each test with fresh rate limit counters."""
+    limiter.reset()
+
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client with CSRF disabled."""
-    app.config['WTF_CSRF_ENABLED'] = False
-    app.config['TESTING'] = True
-    app.config['VALIDATE_PDF'] = False  # Skip PDF structure validation in tests
+    """Create one test client shared by the module's tests."""
     with app.test_client() as client:
         yield client
 
@@ -50,115 +111,40 @@ def test_upload_invalid_extensions(client):
 
 def test_upload_too_large(client):
     """Test error when files are too large."""
-    # Create a file larger than MAX_CONTENT_LENGTH
-    large_content = b'x' * (11 * 1024 * 1024)  # 11MB
-    data = {
-        'resume': create_test_file(content=large_content),
-        'job_description': create_test_file()
-    }
-    response = client.post('/upload', data=data)
+    # Declare a body larger than MAX_CONTENT_LENGTH; the request is rejected
+    # from the header alone, so no 11MB payload needs to be built
+    response = client.post(
+        '/upload',
+        input_stream=BytesIO(b''),
+        content_type='multipart/form-data; boundary=x',
+        environ_overrides={'CONTENT_LENGTH': str(11 * 1024 * 1024)}  # 11MB
+    )
     assert response.status_code == 413  # Request Entity Too Large
     assert 'too large' in response.get_json()['error']['message'].lower()
 
-def test_successful_upload_cleanup(client, tmpdir, monkeypatch):
+@pytest.mark.slow
+def test_successful_upload_cleanup(client, tmpdir, monkeypatch, minimal_pdf_bytes):
     """Test that uploaded files are cleaned up after processing."""
     # Override upload folder for testing
-    app.config['UPLOAD_FOLDER'] = str(tmpdir)
-    
-    # Create valid-looking PDF content with basic structure
-    pdf_content = (
-        b'%PDF-1.4\n'
-        b'1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n'
-        b'2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n'
-        b'3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n'
-        b'xref\n0 4\n0000000000 65535 f\n\n'
-        b'trailer<</Size 4/Root 1 0 R>>\n'
-        b'startxref\n0\n%%EOF\n'
-    )
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmpdir))
     
-    # Mock ResumeParser methods
-    def mock_extract_text(self, path):
-        return "Sample resume text with skills like Python and Java"
-    
-    def mock_get_sections(self):
-        return {
-            'summary': {
-                'text': 'Sample professional summary',
-                'bullet_points': []
-            },
-            'experience': {
-                'text': 'Sample work experience',
-                'bullet_points': ['Led development team', 'Improved processes']
-            },
-            'education': {
-                'text': 'Sample education details',
-                'bullet_points': []
-            },
-            'skills': {
-                'text': 'Python, Java, and other skills',
-                'bullet_points': ['Python', 'Java']
-            }
-        }
-    
-    def mock_get_skills(self):
-            return {'Python': 1, 'Java': 1}
-    
-    def mock_get_contact_info(self):
-        return {
-            'email': 'test@example.com',
-            'phone': '123-456-7890',
-            'linkedin': None,
-            'github': None
-        }
+    # Stand-in parser and scorer, injected where the app builds them
+    fake_parser = MagicMock(spec=ResumeParser)
+    fake_parser.text = MOCK_RESUME_TEXT
+    fake_parser.parse_resume.return_value = MOCK_PARSED_RESUME
+    fake_parser.get_skills.return_value = MOCK_SKILLS
+    fake_parser.get_contact_info.return_value = MOCK_CONTACT_INFO
+    monkeypatch.setattr('src.app.ResumeParser', lambda: fake_parser)
     
-    def mock_init(self):
-        self.text = "Sample resume text with skills like Python and Java"
-        self._text = "Sample resume text with skills like Python and Java"
-        self._skills = ['Python', 'Java']
-        return self
-    
-    def mock_parse_resume(self, file_path=None):
-        self.text = "Sample resume text with skills like Python and Java"
-        return mock_get_sections(self)
-    
-    # Mock ResumeParser
-    monkeypatch.setattr(ResumeParser, '__init__', mock_init)
-    monkeypatch.setattr(ResumeParser, 'extract_text_from_pdf', mock_extract_text)
-    monkeypatch.setattr(ResumeParser, 'extract_text_from_docx', mock_extract_text)
-    monkeypatch.setattr(ResumeParser, 'parse_resume', mock_parse_resume)
-    monkeypatch.setattr(ResumeParser, 'get_skills', mock_get_skills)
-    monkeypatch.setattr(ResumeParser, 'get_contact_info', mock_get_contact_info)
-    monkeypatch.setattr(ResumeParser, 'text', "Sample resume text with skills like Python and Java", raising=False)
-    
-    # Mock ResumeScorer methods
-    def mock_compute_similarity(self, **kwargs):
-        return 0.75
-    
-    def mock_get_important_terms(self, **kwargs):
-        return {
-            'resume_terms': ['Python', 'Java'],
-            'job_terms': ['Python', 'Java']
-        }
-
-    def mock_generate_feedback(self, **kwargs):
-        resume_skills = {'Python': 1, 'Java': 1} if 'resume_skills' not in kwargs else kwargs['resume_skills']
-        job_skills = {'Python': 1, 'Java': 1} if 'job_skills' not in kwargs else kwargs['job_skills']
-        return {
-            'match_percentage': 0.75,
-            'missing_skills': [],
-            'overall_feedback': 'Good match',
-            'suggestions': [],
-            'key_terms': ['Python', 'Java']
-        }
-    
-    # Mock ResumeScorer
-    monkeypatch.setattr(ResumeScorer, 'compute_similarity', mock_compute_similarity)
-    monkeypatch.setattr(ResumeScorer, 'get_important_terms', mock_get_important_terms)
-    monkeypatch.setattr(ResumeScorer, 'generate_feedback', mock_generate_feedback)
+    fake_scorer = MagicMock(spec=ResumeScorer)
+    fake_scorer.compute_similarity.return_value = MOCK_SIMILARITY
+    fake_scorer.get_important_terms.return_value = MOCK_IMPORTANT_TERMS
+    fake_scorer.generate_feedback.return_value = MOCK_FEEDBACK
+    monkeypatch.setattr('src.app.ResumeScorer', lambda: fake_scorer)
     
     data = {
-        'resume': create_test_file(content=pdf_content),
-        'job_description': create_test_file(content=pdf_content)
+        'resume': create_test_file(content=minimal_pdf_bytes),
+        'job_description': create_test_file(content=minimal_pdf_bytes)
     }
     
     response = client.post('/upload', data=data)
@@ -170,5 +156,125 @@ def test_successful_upload_cleanup(client, tmpdir, monkeypatch):
     assert 'analysis' in data
     
     # Verify files were cleaned up
-    files = os.listdir(str(tmpdir))
-    assert not files, "Upload folder should be empty after processing"
\ No newline at end of file
+    with os.scandir(str(tmpdir)) as entries:
+        assert next(entries, None) is None, "Upload folder should be empty after processing"
+
+def _stub_analysis(monkeypatch, app_module, calls,
+                   text="Sample resume text with skills like Python and Java",
+                   stub_enhancer=True):
+    """Replace the parser and verb enhancer with fast stand-ins that log each parse."""
+    def mock_init(self):
+        calls.append('parse')
+        self.text = text
+    
+    def mock_parse_resume(self, file_path=None):
+        return {'skills': {'text': 'Python, Java', 'bullet_points': []}}
+    
+    monkeypatch.setattr(app_module.ResumeParser, '__init__', mock_init)
+    monkeypatch.setattr(app_module.ResumeParser, 'parse_resume', mock_parse_resume)
+    monkeypatch.setattr(app_module.ResumeParser, 'get_skills', lambda self: {'Python': 1})
+    monkeypatch.setattr(app_module.ResumeParser, 'get_contact_info', lambda self: {})
+    # Each test starts without a shared enhancer
+    monkeypatch.setattr(app_module, '_verb_enhancer', None)
+    if stub_enhancer:
+        monkeypatch.setattr(app_module.ActionVerbEnhancer, '__init__', lambda self: None)
+        monkeypatch.setattr(app_module.ActionVerbEnhancer, 'enhance_bullet_points',
+                            lambda self, text, n_process=1: [])
+
+def _post_sample(client, resume=b'Python and Java. ' * 10):
+    """Upload a small resume and job description."""
+    return client.post('/upload', data={
+        'resume': create_test_file('resume.txt', resume),
+        'job_description': create_test_file('job.txt', b'Python developer. ' * 10)
+    })
+
+def test_repeat_upload_uses_cached_analysis(client, tmpdir, monkeypatch):
+    """Test that uploading the same files again skips re-analysis."""
+    import src.app as app_module
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmpdir))
+    monkeypatch.setattr(app_module, '_analysis_cache', app_module.OrderedDict())
+    
+    calls = []
+    _stub_analysis(monkeypatch, app_module, calls)
+    
+    first = _post_sample(client)
+    assert first.status_code == 200, f"Response: {first.get_json()}"
+    assert calls == ['parse', 'parse']
+    
+    second = _post_sample(client)
+    assert second.status_code == 200
+    assert calls == ['parse', 'parse']
+    first_analysis = first.get_json()['analysis']
+    second_analysis = second.get_json()['analysis']
+    first_analysis.pop('id', None)
+    second_analysis.pop('id', None)
+    assert second_analysis == first_analysis
+    with os.scandir(str(tmpdir)) as entries:
+        assert next(entries, None) is None
+
+def test_failed_format_analysis_not_cached(client, tmpdir, monkeypatch):
+    """Test that an analysis whose format check failed is redone on the next upload."""
+    import src.app as app_module
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmpdir))
+    monkeypatch.setattr(app_module, '_analysis_cache', app_module.OrderedDict())
+    
+    calls = []
+    _stub_analysis(monkeypatch, app_module, calls)
+    
+    analyze_resume_format = app_module.analyze_resume_format
+    failures = [RuntimeError("format check unavailable")]
+    
+    def flaky_format(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return analyze_resume_format(*args, **kwargs)
+    monkeypatch.setattr(app_module, 'analyze_resume_format', flaky_format)
+    
+    first = _post_sample(client)
+    assert first.status_code == 200, f"Response: {first.get_json()}"
+    assert first.get_json()['analysis']['format_analysis'] is None
+    
+    second = _post_sample(client)
+    assert second.status_code == 200
+    assert calls == ['parse', 'parse', 'parse', 'parse']
+    assert second.get_json()['analysis']['format_analysis'] is not None
+
+def test_verb_enhancer_shared_across_uploads(client, tmpdir, monkeypatch):
+    """Test that a second upload reuses the enhancer and its cached bullets."""
+    import spacy
+    import src.app as app_module
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmpdir))
+    monkeypatch.setattr(app_module, '_analysis_cache', app_module.OrderedDict())
+    
+    calls = []
+    _stub_analysis(monkeypatch, app_module, calls,
+                   text="Experience\n• Helped with the launch\n• Spearheaded the rollout",
+                   stub_enhancer=False)
+    
+    # A blank pipeline stands in for the model; count how often it is loaded
+    loads = []
+    
+    def blank_load(*args, **kwargs):
+        loads.append(args)
+        return spacy.blank('en')
+    monkeypatch.setattr(spacy, 'load', blank_load)
+    
+    analyzed = []
+    analyze = app_module.ActionVerbEnhancer._analyze_bullet_point
+    
+    def counting_analyze(self, bullet, doc=None):
+        analyzed.append(bullet)
+        return analyze(self, bullet, doc)
+    monkeypatch.setattr(app_module.ActionVerbEnhancer, '_analyze_bullet_point', counting_analyze)
+    
+    # Different uploads, so the analysis cache does not answer the second
+    first = _post_sample(client, b'Python and Java. ' * 10)
+    assert first.status_code == 200, f"Response: {first.get_json()}"
+    second = _post_sample(client, b'Java and Python. ' * 10)
+    assert second.status_code == 200
+    
+    assert calls == ['parse'] * 4
+    assert len(loads) == 1
+    assert sorted(analyzed) == ["Helped with the launch", "Spearheaded the rollout"]
+    assert second.get_json()['analysis']['verb_enhancements'] == \
+        first.get_json()['analysis']['verb_enhancements']
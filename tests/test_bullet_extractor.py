@@ -1,120 +1,66 @@
 """
 Tests for bullet point extraction functionality.
 """
-import unittest
+import pytest
 from src.resume_parser.bullet_extractor import BulletPointExtractor
 
-class TestBulletPointExtractor(unittest.TestCase):
-    """Test cases for BulletPointExtractor class."""
-    
-    def setUp(self):
-        """Set up test cases."""
-        self.extractor = BulletPointExtractor()
-    
-    def test_extract_bullet_points_with_bullets(self):
-        """Test extracting bullet points with bullet characters."""
-        text = """Experience:
+@pytest.fixture(scope="session")
+def extractor():
+    """Create one BulletPointExtractor, shared read-only by all tests."""
+    return BulletPointExtractor()
+
+@pytest.mark.parametrize("text,expected", [
+    # Test extracting bullet points with bullet characters
+    pytest.param("""Experience:
         • Led team of 5 developers on cloud migration project
         • Implemented CI/CD pipeline using Jenkins
-        • Reduced deployment time by 60%"""
-        
-        expected = [
-            "Led team of 5 developers on cloud migration project.",
-            "Implemented CI/CD pipeline using Jenkins.",
-            "Reduced deployment time by 60%."
-        ]
-        
-        result = self.extractor.extract_bullet_points(text)
-        self.assertEqual(result, expected)
-    
-    def test_extract_bullet_points_with_dashes(self):
-        """Test extracting bullet points with dashes."""
-        text = """Key Achievements:
+        • Reduced deployment time by 60%""", [
+        "Led team of 5 developers on cloud migration project.",
+        "Implemented CI/CD pipeline using Jenkins.",
+        "Reduced deployment time by 60%."
+    ], id="with_bullets"),
+    # Test extracting bullet points with dashes
+    pytest.param("""Key Achievements:
         - Increased test coverage to 95%
         - Fixed 100+ critical bugs
-        - Mentored 3 junior developers"""
-        
-        expected = [
-            "Increased test coverage to 95%.",
-            "Fixed 100+ critical bugs.",
-            "Mentored 3 junior developers."
-        ]
-        
-        result = self.extractor.extract_bullet_points(text)
-        self.assertEqual(result, expected)
-    
-    def test_extract_bullet_points_with_numbers(self):
-        """Test extracting bullet points with numbers."""
-        text = """Project Highlights:
+        - Mentored 3 junior developers""", [
+        "Increased test coverage to 95%.",
+        "Fixed 100+ critical bugs.",
+        "Mentored 3 junior developers."
+    ], id="with_dashes"),
+    # Test extracting bullet points with numbers
+    pytest.param("""Project Highlights:
         1. Designed scalable microservices architecture
         2. Implemented OAuth2 authentication
-        3. Deployed to AWS using Terraform"""
-        
-        expected = [
-            "Designed scalable microservices architecture.",
-            "Implemented OAuth2 authentication.",
-            "Deployed to AWS using Terraform."
-        ]
-        
-        result = self.extractor.extract_bullet_points(text)
-        self.assertEqual(result, expected)
-    
-    def test_extract_bullet_points_mixed_formats(self):
-        """Test extracting bullet points with mixed formats."""
-        text = """Experience:
+        3. Deployed to AWS using Terraform""", [
+        "Designed scalable microservices architecture.",
+        "Implemented OAuth2 authentication.",
+        "Deployed to AWS using Terraform."
+    ], id="with_numbers"),
+    # Test extracting bullet points with mixed formats
+    pytest.param("""Experience:
         • Backend Development
         - Python/Django API development
         1. Implemented RESTful endpoints
         * Wrote comprehensive tests
-        → Deployed to production"""
-        
-        expected = [
-            "Backend Development.",
-            "Python/Django API development.",
-            "Implemented RESTful endpoints.",
-            "Wrote comprehensive tests.",
-            "Deployed to production."
-        ]
-        
-        result = self.extractor.extract_bullet_points(text)
-        self.assertEqual(result, expected)
-    
-    def test_format_bullet_points(self):
-        """Test formatting bullet points consistently."""
-        bullet_points = [
-            "Led development team.",
-            "Implemented new features.",
-            "Improved performance."
-        ]
-        
-        expected = [
-            "• Led development team.",
-            "• Implemented new features.",
-            "• Improved performance."
-        ]
-        
-        result = self.extractor.format_bullet_points(bullet_points)
-        self.assertEqual(result, expected)
-    
-    def test_multiline_bullet_points(self):
-        """Test extracting bullet points that span multiple lines."""
-        text = """Experience:
+        → Deployed to production""", [
+        "Backend Development.",
+        "Python/Django API development.",
+        "Implemented RESTful endpoints.",
+        "Wrote comprehensive tests.",
+        "Deployed to production."
+    ], id="mixed_formats"),
+    # Test extracting bullet points that span multiple lines
+    pytest.param("""Experience:
         • Led development team working on 
           high-performance trading platform
         • Implemented advanced features for
-          real-time market data analysis"""
-        
-        expected = [
-            "Led development team working on high-performance trading platform.",
-            "Implemented advanced features for real-time market data analysis."
-        ]
-        
-        result = self.extractor.extract_bullet_points(text)
-        self.assertEqual(result, expected)
-    
-    def test_nested_bullet_points(self):
-        """Test extracting nested bullet points."""
-        text = """Skills:
+          real-time market data analysis""", [
+        "Led development team working on high-performance trading platform.",
+        "Implemented advanced features for real-time market data analysis."
+    ], id="multiline"),
+    # Test extracting nested bullet points
+    pytest.param("""Skills:
         • Programming Languages:
           - Python
           - Java
@@ -122,21 +68,42 @@ class TestBulletPointExtractor(unittest.TestCase):
         • Tools:
           - Git
           - Docker
-          - Jenkins"""
-        
-        expected = [
-            "Programming Languages:",
-            "Python.",
-            "Java.",
-            "JavaScript.",
-            "Tools:",
-            "Git.",
-            "Docker.",
-            "Jenkins."
-        ]
-        
-        result = self.extractor.extract_bullet_points(text)
-        self.assertEqual(result, expected)
+          - Jenkins""", [
+        "Programming Languages:",
+        "Python.",
+        "Java.",
+        "JavaScript.",
+        "Tools:",
+        "Git.",
+        "Docker.",
+        "Jenkins."
+    ], id="nested")
+])
+def test_extract_bullet_points(extractor, text, expected):
+    """Test extracting bullet points from each supported format."""
+    assert extractor.extract_bullet_points(text) == expected
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+def test_format_bullet_points(extractor):
+    """Test formatting bullet points consistently."""
+    bullet_points = [
+        "Led development team.",
+        "Implemented new features.",
+        "Improved performance."
+    ]
+    
+    expected = [
+        "• Led development team.",
+        "• Implemented new features.",
+        "• Improved performance."
+    ]
+    
+    assert extractor.format_bullet_points(bullet_points) == expected
+
+def test_extract_long_bullet_list(extractor):
+    """Test a long list is split into one point per marker line."""
+    text = "• Built feature\n- Fixed bug\n1. Shipped release\n" * 3000
+    
+    bullet_points = extractor.extract_bullet_points(text)
+    
+    assert len(bullet_points) == 9000
+    assert bullet_points[:3] == ["Built feature.", "Fixed bug.", "Shipped release."]
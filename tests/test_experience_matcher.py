@@ -4,9 +4,9 @@ Tests for the experience matching functionality.
 import pytest
 from experience_matcher import ExperienceMatcher
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def matcher():
-    """Create an ExperienceMatcher instance for testing."""
+    """Create one ExperienceMatcher, shared read-only by all tests."""
     return ExperienceMatcher()
 
 def test_extract_years_of_experience(matcher):
@@ -4,9 +4,9 @@ Tests for the industry keyword analysis functionality.
 import pytest
 from keyword_analyzer import IndustryKeywordAnalyzer
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def analyzer():
-    """Create an IndustryKeywordAnalyzer instance for testing."""
+    """Create one IndustryKeywordAnalyzer, shared read-only by all tests."""
     return IndustryKeywordAnalyzer()
 
 def test_industry_detection(analyzer):
@@ -30,6 +30,13 @@ def test_industry_detection(analyzer):
     assert len(industries) > 0
     assert 'data_science' == industries[0][0]  # First result should be data science
 
+def test_terms_in(analyzer):
+    """Test finding every industry term that occurs in a text."""
+    found = analyzer._terms_in("senior python developer, machine learning and ci/cd")
+    
+    assert {'python', 'machine learning', 'ci/cd'} <= found
+    assert 'java' not in found
+
 def test_keyword_extraction(analyzer):
     """Test extracting industry-specific keywords."""
     text = """
@@ -39,18 +46,19 @@ def test_keyword_extraction(analyzer):
     """
     
     keywords = analyzer.extract_industry_keywords(text, ['software'])
+    found = set().union(*keywords.values())
     
     # Should find programming languages
-    assert any('Python' in terms for terms in keywords.values())
-    assert any('JavaScript' in terms for terms in keywords.values())
+    assert 'Python' in found
+    assert 'JavaScript' in found
     
     # Should find frameworks
-    assert any('Django' in terms for terms in keywords.values())
-    assert any('React' in terms for terms in keywords.values())
+    assert 'Django' in found
+    assert 'React' in found
     
     # Should find tools
-    assert any('Docker' in terms for terms in keywords.values())
-    assert any('Jenkins' in terms for terms in keywords.values())
+    assert 'Docker' in found
+    assert 'Jenkins' in found
 
 def test_keyword_match_analysis(analyzer):
     """Test analyzing keyword matches between resume and job."""
@@ -78,14 +86,14 @@ def test_keyword_match_analysis(analyzer):
     assert 'scores' in analysis
     
     # Should identify matching keywords
-    matches = analysis['matches']['matching_keywords']
-    assert any('Python' in terms for terms in matches.values())
-    assert any('React' in terms for terms in matches.values())
+    matches = set().union(*analysis['matches']['matching_keywords'].values())
+    assert 'Python' in matches
+    assert 'React' in matches
     
     # Should identify gaps
-    gaps = analysis['matches']['missing_keywords']
-    assert any('Django' in terms for terms in gaps.values())
-    assert any('AWS' in terms for terms in gaps.values())
+    gaps = set().union(*analysis['matches']['missing_keywords'].values())
+    assert 'Django' in gaps
+    assert 'AWS' in gaps
 
 def test_keyword_suggestions(analyzer):
     """Test generating keyword improvement suggestions."""
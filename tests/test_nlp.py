@@ -1,10 +1,5 @@
-from resume_parser.parser import ResumeParser
-
-
-def test_nlp_section_classification():
+def test_nlp_section_classification(parser, cached_doc):
     """Test NLP-based section classification"""
-    parser = ResumeParser()
-
     # Test text with clear section markers
     test_text = """
 John Smith
@@ -27,7 +22,7 @@ Python, TensorFlow, AWS
 """
 
     parser.text = test_text
-    parser.doc = parser.nlp(test_text)
+    parser.doc = cached_doc(parser.nlp, test_text)
     sections = parser.parse_resume(None)  # None because we set text directly
 
     # Check if major sections are identified
@@ -37,10 +32,8 @@ Python, TensorFlow, AWS
     assert any('skills' in section.lower() for section in sections)
 
 
-def test_nlp_skill_extraction():
+def test_nlp_skill_extraction(parser, cached_doc):
     """Test NLP-based skill extraction"""
-    parser = ResumeParser()
-
     # Test text with various skill formats
     test_text = """
 Technical Skills:
@@ -55,7 +48,7 @@ Experienced in Agile/Scrum
 """
 
     parser.text = test_text
-    parser.doc = parser.nlp(test_text)
+    parser.doc = cached_doc(parser.nlp, test_text)
     skills = parser.get_skills()
 
     # Check if common skills are identified
@@ -64,10 +57,8 @@ Experienced in Agile/Scrum
         assert any(skill.lower() in s.lower() for s in skills)
 
 
-def test_entity_recognition():
+def test_entity_recognition(parser, cached_doc):
     """Test entity recognition in resume text"""
-    parser = ResumeParser()
-
     test_text = """
 Jane Smith
 Email: jane.smith@email.com
@@ -83,7 +74,7 @@ January 2020 - Present
 """
 
     parser.text = test_text
-    doc = parser.nlp(test_text)
+    doc = cached_doc(parser.nlp, test_text)
 
     # Check if key entities are recognized
     entities = [(ent.text, ent.label_) for ent in doc.ents]
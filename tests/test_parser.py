@@ -3,35 +3,46 @@ Tests for the resume parser module with NLP capabilities.
 """
 import os
 import pytest
-import spacy
-from resume_parser.parser import ResumeParser
 
-# Load spaCy model for testing
-nlp = spacy.load("en_core_web_sm")
-
-def test_extract_text_from_docx(tmp_path):
-    """Test DOCX text extraction"""
-    # Create a test DOCX file
+@pytest.fixture(scope="session")
+def sample_docx(tmp_path_factory):
+    """Path to a small test DOCX file, written once per session."""
     from docx import Document
     doc = Document()
     doc.add_paragraph('Test Resume')
     doc.add_paragraph('Education')
     doc.add_paragraph('Bachelor in Computer Science')
-    doc_path = os.path.join(tmp_path, "test_resume.docx")
+    doc_path = os.path.join(tmp_path_factory.mktemp("docx"), "test_resume.docx")
     doc.save(doc_path)
-    
-    # Parse the test file
-    parser = ResumeParser()
-    text = parser.extract_text_from_docx(doc_path)
+    return doc_path
+
+def test_extract_text_from_docx(sample_docx, parser):
+    """Test DOCX text extraction"""
+    text = parser.extract_text_from_docx(sample_docx)
     
     assert 'Test Resume' in text
     assert 'Education' in text
     assert 'Bachelor in Computer Science' in text
 
-def test_parse_sections():
-    """Test section identification"""
-    parser = ResumeParser()
+def test_extract_text_from_docx_runs(tmp_path, parser):
+    """Test DOCX tabs and line breaks are kept and table text is skipped"""
+    from docx import Document
+    doc = Document()
+    paragraph = doc.add_paragraph('Skills')
+    paragraph.add_run().add_tab()
+    paragraph.add_run('Python')
+    paragraph.add_run().add_break()
+    paragraph.add_run('SQL')
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = 'Table cell'
+    doc.add_paragraph('')
+    doc.add_paragraph('Education')
+    doc_path = os.path.join(tmp_path, "runs.docx")
+    doc.save(doc_path)
     
+    assert parser.extract_text_from_docx(doc_path) == 'Skills\tPython\nSQL\nEducation'
+
+def test_parse_sections(parser):
+    """Test section identification"""
     # Simulate parsed text
     parser.text = """
     John Doe
@@ -72,10 +83,8 @@ def test_parse_sections():
     assert 'software engineer' in _section_text(sections['experience']).lower()
     assert 'python' in _section_text(sections['skills']).lower()
 
-def test_get_contact_info():
+def test_get_contact_info(parser):
     """Test contact information extraction"""
-    parser = ResumeParser()
-    
     # Simulate contact section
     parser.sections = {
         'contact': """
@@ -94,10 +103,8 @@ def test_get_contact_info():
     assert 'linkedin.com/in/johndoe' in contact_info['linkedin']
     assert 'github.com/johndoe' in contact_info['github']
 
-def test_get_skills():
+def test_get_skills(parser):
     """Test skills extraction"""
-    parser = ResumeParser()
-    
     # Simulate skills section
     parser.sections = {
         'skills': """
@@ -118,10 +125,8 @@ def test_get_skills():
     assert 'Tools: Git' in skills
     assert 'Cloud: Docker' in skills  # Docker is auto-categorized as Cloud
 
-def test_get_education():
+def test_get_education(parser):
     """Test education information extraction"""
-    parser = ResumeParser()
-    
     # Simulate education section
     parser.section_details = {
         'education': {
@@ -157,10 +162,8 @@ def test_get_education():
     assert harvard['graduation'] == '2020'
     assert harvard['gpa'] == '3.9'
 
-def test_get_experience():
+def test_get_experience(parser):
     """Test experience information extraction"""
-    parser = ResumeParser()
-    
     # Simulate experience section
     parser.section_details = {
         'experience': {
@@ -202,4 +205,50 @@ def test_get_experience():
     assert microsoft['end_date'] == 'December 2019'
     assert microsoft['location'] == 'Redmond, WA'
     assert len(microsoft['achievements']) == 3
-    assert any('Azure' in bullet for bullet in microsoft['achievements'])
\ No newline at end of file
+    assert any('Azure' in bullet for bullet in microsoft['achievements'])
+
+def test_parse_many(tmp_path, parser):
+    """Test parsing several resumes in one batch"""
+    paths = []
+    for name, skill in (("a.txt", "Python"), ("b.txt", "Docker")):
+        path = tmp_path / name
+        path.write_text(f"Jane Doe\n\nSkills\nTools: {skill}, Git\n")
+        paths.append(str(path))
+    
+    results = parser.parse_many(paths)
+    
+    assert [r['file_path'] for r in results] == paths
+    assert all('skills' in r['sections'] for r in results)
+    assert 'Tools: Python' in results[0]['skills']
+    assert 'Cloud: Docker' in results[1]['skills']
+    # The batch leaves no resume loaded on the parser
+    assert parser.text == ""
+    assert parser.sections == {}
+
+def test_results_memoized_per_text(parser):
+    """Test get_* results are reused until the input text changes"""
+    parser.sections = {'contact': "Jane Doe\nEmail: jane@example.com"}
+    
+    first = parser.get_contact_info()
+    assert parser.get_contact_info() is first
+    
+    parser.sections = {'contact': "Jane Doe\nEmail: jane@other.org"}
+    assert parser.get_contact_info()['email'] == 'jane@other.org'
+
+def test_section_details_memoized_per_text(parser):
+    """Test education and experience are re-extracted only when their text changes"""
+    parser.section_details = {
+        'education': {'text': "Stanford University\nBachelor of Science in Physics, 2020", 'bullet_points': []},
+        'experience': {'text': "Software Engineer at Acme, Austin, TX\nJune 2018 - May 2020", 'bullet_points': []}
+    }
+    
+    education = parser.get_education()
+    experience = parser.get_experience()
+    assert parser.get_education() is education
+    assert parser.get_experience() is experience
+    
+    parser.section_details['education'] = {
+        'text': "Harvard University\nMaster of Science in Data Science, 2022", 'bullet_points': []
+    }
+    assert parser.get_education()[0]['major'] == 'Data Science'
+    assert parser.get_experience() is experience
@@ -7,9 +7,14 @@ from src.resume_parser.parser import ResumeParser
 class TestResumeParserBulletPoints(unittest.TestCase):
     """Test cases for ResumeParser bullet point functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one parser for all test cases."""
+        cls.parser = ResumeParser()
+    
     def setUp(self):
-        """Set up test cases."""
-        self.parser = ResumeParser()
+        """Clear the previous test's resume state."""
+        self.parser._reset_text()
         
     def test_experience_bullet_points(self):
         """Test extracting bullet points from experience section."""
@@ -1,12 +1,13 @@
 """
 Tests for the resume scoring module.
 """
+import random
 import pytest
 from scorer.scorer import ResumeScorer
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scorer():
-    """Create a ResumeScorer instance for testing."""
+    """Create one ResumeScorer shared by the module's tests."""
     return ResumeScorer()
 
 def test_similarity_score(scorer):
@@ -28,6 +29,38 @@ def test_similarity_score(scorer):
     # Should have high similarity due to matching skills
     assert 0.35 <= similarity <= 1.0, f"Similarity score {similarity} is too low"
 
+def test_similarity_bounded_and_symmetric(scorer):
+    """Test similarity stays in [0, 1] and ignores argument order on random texts."""
+    rng = random.Random(0)
+    vocab = ['python', 'java', 'sql', 'developer', 'machine', 'learning',
+             'the', 'and', 'C++', 'Résumé', '数据', '-', '.', '\n']
+    for _ in range(300):
+        a = ' '.join(rng.choice(vocab) for _ in range(rng.randint(0, 60)))
+        b = a + ' ' if rng.random() < 0.2 else ' '.join(
+            rng.choice(vocab) for _ in range(rng.randint(0, 60)))
+        
+        similarity = scorer.compute_similarity(a, b)
+        
+        assert 0.0 <= similarity <= 1.0
+        assert similarity == pytest.approx(scorer.compute_similarity(b, a))
+
+def test_similarity_batch_matches_pairwise(scorer):
+    """Test batch similarity agrees with scoring each resume on its own."""
+    job_text = "Looking for a Python developer with SQL and AWS experience"
+    resumes = [
+        "Python developer with SQL experience",
+        "Java engineer",
+        "   ",
+        job_text,
+        "the and of"
+    ]
+    
+    scores = scorer.compute_similarity_batch(resumes, job_text)
+    
+    assert scores == pytest.approx([scorer.compute_similarity(r, job_text) for r in resumes])
+    assert scorer.compute_similarity_batch(resumes, "  ") == [0.0] * len(resumes)
+    assert scorer.compute_similarity_batch([], job_text) == []
+
 def test_important_terms(scorer):
     """Test extraction of important terms."""
     resume_text = "Experienced Python developer with AWS and Docker experience"
@@ -53,6 +86,15 @@ def test_missing_skills(scorer):
     assert 'Python' not in missing
     assert 'SQL' not in missing
 
+def test_missing_skills_large_lists(scorer):
+    """Test missing skills on large skill lists, ignoring case."""
+    resume_skills = [f"Skill{i}" for i in range(10000)]
+    job_skills = [f"skill{i}" for i in range(9990, 11000)]
+    
+    missing = scorer.get_missing_skills(resume_skills, job_skills)
+    
+    assert missing == job_skills[10:]
+
 def test_feedback_generation(scorer):
     """Test feedback generation."""
     resume_text = "Python developer with SQL experience"
@@ -73,4 +115,46 @@ def test_feedback_generation(scorer):
     assert 'missing_skills' in feedback
     assert 'suggestions' in feedback
     assert isinstance(feedback['suggestions'], list)
-    assert 'Java' in feedback['missing_skills']
\ No newline at end of file
+    assert 'Java' in feedback['missing_skills']
+
+def test_sparse_cosine_matches_sparse_dot(scorer):
+    """Test the merge-join cosine kernel against the sparse dot product."""
+    from scorer.scorer import _sparse_cosine
+    
+    scorer.compute_similarity(
+        "Python developer with SQL and Docker experience",
+        "Looking for Python developer with SQL and Java experience"
+    )
+    rows = scorer.vectorizer.transform(scorer._terms)
+    rows.sort_indices()
+    resume_row, job_row = rows.getrow(0), rows.getrow(1)
+    
+    expected = resume_row.multiply(job_row).sum()
+    result = _sparse_cosine(
+        resume_row.indices, resume_row.data, job_row.indices, job_row.data
+    )
+    assert result == pytest.approx(expected)
+    assert _sparse_cosine(
+        resume_row.indices, resume_row.data, job_row.indices[:0], job_row.data[:0]
+    ) == 0.0
+
+def test_similarity_trivial_inputs(scorer):
+    """Test empty and identical inputs."""
+    text = "Python developer with SQL experience"
+    
+    assert scorer.compute_similarity("   ", text) == 0.0
+    assert 'python' in scorer.get_important_terms()['job_terms']
+    
+    assert scorer.compute_similarity(text, text) == 1.0
+    assert 'python' in scorer.get_important_terms()['resume_terms']
+
+def test_repeated_text_analyzed_once(scorer):
+    """Test that a job description scored again reuses its n-grams."""
+    from scorer.scorer import _analyze
+    job_text = "Backend engineer with Go and Postgres experience"
+    
+    scorer.compute_similarity("Go developer", job_text)
+    hits = _analyze.cache_info().hits
+    scorer.compute_similarity("Postgres administrator", job_text)
+    
+    assert _analyze.cache_info().hits == hits + 1
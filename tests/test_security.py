@@ -0,0 +1,44 @@
+"""
+Tests for file security checks.
+"""
+from security import validate_pdf_structure
+
+def _write_pdf(tmp_path, content: bytes) -> str:
+    """Write PDF bytes to a temporary file and return its path."""
+    path = tmp_path / 'test.pdf'
+    path.write_bytes(content)
+    return str(path)
+
+def test_validate_pdf_structure_small_pdf(tmp_path, minimal_pdf_bytes):
+    """Test that a valid PDF smaller than 1KiB is accepted."""
+    assert len(minimal_pdf_bytes) < 1024
+    
+    assert validate_pdf_structure(_write_pdf(tmp_path, minimal_pdf_bytes)) == (True, None)
+
+def test_validate_pdf_structure_padding_after_eof(tmp_path, minimal_pdf_bytes):
+    """Test that an EOF marker followed by more than 64 bytes of padding is found."""
+    content = minimal_pdf_bytes + b'\0' * 200
+    
+    assert validate_pdf_structure(_write_pdf(tmp_path, content)) == (True, None)
+
+def test_validate_pdf_structure_missing_eof(tmp_path, minimal_pdf_bytes):
+    """Test that a PDF without an EOF marker is rejected."""
+    content = minimal_pdf_bytes.replace(b'%%EOF', b'')
+    
+    is_valid, error = validate_pdf_structure(_write_pdf(tmp_path, content))
+    assert not is_valid
+    assert 'missing EOF marker' in error
+
+def test_validate_pdf_structure_eof_outside_window(tmp_path, minimal_pdf_bytes):
+    """Test that an EOF marker buried under more than 1KiB of padding is rejected."""
+    content = minimal_pdf_bytes + b'\0' * 2048
+    
+    is_valid, error = validate_pdf_structure(_write_pdf(tmp_path, content))
+    assert not is_valid
+    assert 'missing EOF marker' in error
+
+def test_validate_pdf_structure_invalid_header(tmp_path):
+    """Test that a file without the PDF header is rejected."""
+    is_valid, error = validate_pdf_structure(_write_pdf(tmp_path, b'not a pdf\n%%EOF\n'))
+    assert not is_valid
+    assert error == "Invalid PDF header"
@@ -4,11 +4,15 @@ Tests for the enhanced skills gap analysis functionality.
 import pytest
 from scorer.scorer import ResumeScorer
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scorer():
-    """Create a ResumeScorer instance for testing."""
+    """Create one ResumeScorer shared by the module's tests."""
     return ResumeScorer()
 
+def _cf(skills):
+    """Case-fold a list of skills into a set for membership checks."""
+    return {skill.casefold() for skill in skills}
+
 def test_skills_gap_analysis(scorer):
     """Test the detailed skills gap analysis functionality."""
     resume_text = """
@@ -32,28 +36,20 @@ def test_skills_gap_analysis(scorer):
     analysis = scorer.get_skills_gap_analysis(resume_text, job_text)
     
     # Check critical missing skills
-    assert "tensorflow" in [s.lower() for s in analysis['gaps']['critical_missing']], \
+    assert "tensorflow" in _cf(analysis['gaps']['critical_missing']), \
         "TensorFlow should be identified as a critical missing skill"
     
     # Check nice to have missing skills
-    assert "kubernetes" in [s.lower() for s in analysis['gaps']['nice_to_have_missing']], \
-        "Kubernetes should be identified as a nice-to-have missing skill"
-    assert "react" in [s.lower() for s in analysis['gaps']['nice_to_have_missing']], \
-        "React should be identified as a nice-to-have missing skill"
+    assert {"kubernetes", "react"} <= _cf(analysis['gaps']['nice_to_have_missing']), \
+        "Kubernetes and React should be identified as nice-to-have missing skills"
     
     # Check matched skills
-    assert "python" in [s.lower() for s in analysis['matches']['matched_skills']], \
-        "Python should be identified as a matched skill"
-    assert "sql" in [s.lower() for s in analysis['matches']['matched_skills']], \
-        "SQL should be identified as a matched skill"
-    assert "aws" in [s.lower() for s in analysis['matches']['matched_skills']], \
-        "AWS should be identified as a matched skill"
+    assert {"python", "sql", "aws"} <= _cf(analysis['matches']['matched_skills']), \
+        "Python, SQL and AWS should be identified as matched skills"
     
     # Check additional skills
-    assert "javascript" in [s.lower() for s in analysis['matches']['additional_skills']], \
-        "JavaScript should be identified as an additional skill"
-    assert "docker" in [s.lower() for s in analysis['matches']['additional_skills']], \
-        "Docker should be identified as an additional skill"
+    assert {"javascript", "docker"} <= _cf(analysis['matches']['additional_skills']), \
+        "JavaScript and Docker should be identified as additional skills"
 
 def test_skills_gap_empty_texts(scorer):
     """Test skills gap analysis with empty texts."""
@@ -66,4 +62,27 @@ def test_skills_gap_empty_texts(scorer):
     assert len(analysis['matches']['matched_skills']) == 0, \
         "Empty texts should result in no matched skills"
     assert len(analysis['matches']['additional_skills']) == 0, \
-        "Empty texts should result in no additional skills"
\ No newline at end of file
+        "Empty texts should result in no additional skills"
+
+def test_skills_gap_ignores_previous_comparison(scorer):
+    """Test that the analysis uses its own texts, not the last compared ones."""
+    scorer.compute_similarity("Go developer", "Required: Go")
+    
+    analysis = scorer.get_skills_gap_analysis("Rust developer", "Required: Rust")
+    
+    matched = _cf(analysis['matches']['matched_skills'])
+    assert "rust" in matched
+    assert "go" not in matched
+
+def test_first_occurrences():
+    """Test that each skill is located at its earliest offset."""
+    from scorer.scorer import _first_occurrences
+    
+    text = "python and machine learning; more python, learning sql"
+    offsets = _first_occurrences(text, ['python', 'learning', 'machine learning', 'java'])
+    
+    assert offsets == {
+        'python': text.find('python'),
+        'learning': text.find('learning'),
+        'machine learning': text.find('machine learning'),
+    }
@@ -113,4 +113,15 @@ def test_empty_inputs(engine):
     
     # Should suggest adding all major sections
     assert len(suggestions) > 0
-    assert all(section in suggestions for section in ['education', 'experience', 'skills', 'summary'])
\ No newline at end of file
+    assert all(section in suggestions for section in ['education', 'experience', 'skills', 'summary'])
+
+def test_requirements_match_whole_words(engine):
+    """Test that section requirements are matched against content words."""
+    suggestions = engine.analyze_section(
+        'projects', "Inventory app, my role: backend lead", "Python developer"
+    )
+    
+    # 'role/responsibilities' is satisfied by the word 'role'
+    assert "Add role/responsibilities to your projects section" not in suggestions
+    # Neither 'team' nor 'size' appears in the content
+    assert "Add team size to your projects section" in suggestions
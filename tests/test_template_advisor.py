@@ -0,0 +1,60 @@
+"""
+Tests for resume format analysis and template recommendations.
+"""
+import numpy as np
+import pytest
+from template_advisor import (
+    TEMPLATE_RECOMMENDATIONS, analyze_resume_format, get_template_recommendation,
+    _scan_ascii, _scan_text
+)
+
+CONTACT_INFO = {'email': 'jane@example.com', 'phone': '123-456-7890'}
+
+def test_sections_ignore_unicode_case_variants():
+    """Test that 'ſkills' (long s) does not stand in for a missing Skills header."""
+    text = "ſkills Education Experience. Skills: Python"
+    
+    result = analyze_resume_format(text, CONTACT_INFO)
+    
+    assert not any(issue.startswith('Missing common sections') for issue in result['issues'])
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "  Led team of 5\n",
+    "Skills\x0bPython\x0cSQL",
+    "a\x1cb\x1dc\x1ed\x1ff",
+    "\x1c\x1d\x1e\x1f",
+    "Name | Role | Years",
+    "no digits here\r\n\tor pipes",
+    "x|y 2024",
+])
+def test_scan_ascii_matches_str_methods(text):
+    """Test the byte scanner against str.split and the digit and pipe checks."""
+    expected = (
+        len(text.split()),
+        any(c.isdigit() for c in text),
+        '|' in text
+    )
+    data = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    
+    assert tuple(_scan_ascii(data)) == expected
+    assert tuple(_scan_text(text)) == expected
+
+@pytest.mark.parametrize("job_description,expected", [
+    # Executive keywords win over technical ones, and technical over creative
+    ("Software Engineer reporting to the Director", "executive"),
+    ("Marketing engineer", "technical"),
+    ("Brand designer", "creative"),
+    ("Head of Design", "executive"),
+    # Keywords on later lines still count
+    ("Job posting\n\nWe need a\nsenior DEVELOPER", "technical"),
+    ("About us\nRole: Copy writer\nReports to: VP Sales", "executive"),
+    ("Accountant for a growing firm", "modern_professional"),
+    ("", "modern_professional"),
+])
+def test_template_recommendation_job_type(job_description, expected):
+    """Test the job type priority used to pick a template."""
+    result = get_template_recommendation(70, [], job_description)
+    
+    assert result['recommended_template']['name'] == TEMPLATE_RECOMMENDATIONS[expected]['name']
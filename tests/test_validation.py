@@ -1,8 +1,10 @@
 """Tests for validation utilities and API error handling."""
+import mmap
 import os
 import pytest
 from io import BytesIO
-from src.validation import validate_file_upload, validate_file_size, ValidationError, error_response
+from tempfile import SpooledTemporaryFile
+from src.validation import validate_file_upload, validate_file_size, ValidationError, error_response, _stream_file_size
 
 class MockFileStorage:
     """Mock Werkzeug's FileStorage for testing."""
@@ -17,6 +19,22 @@ class MockFileStorage:
     def tell(self):
         return self._size
 
+@pytest.fixture
+def sized_file():
+    """Build mock uploads of a given size backed by lazily paged anonymous memory."""
+    maps = []
+    
+    def build(size: int) -> MockFileStorage:
+        file = MockFileStorage(filename='test.pdf')
+        file.stream = mmap.mmap(-1, size)
+        file._size = size
+        maps.append(file.stream)
+        return file
+    
+    yield build
+    for m in maps:
+        m.close()
+
 def test_validate_file_upload_success():
     """Test successful file validation."""
     file = MockFileStorage(filename='test.pdf', content=b'test content')
@@ -51,15 +69,46 @@ def test_validate_file_upload_invalid_extension():
         validate_file_upload(file, 'Resume', {'pdf', 'docx'})
     assert 'Invalid file type' in str(exc.value)
 
-def test_validate_file_size_success():
+def test_validate_file_size_success(sized_file):
     """Test file size validation success."""
-    file = MockFileStorage(content=b'x' * 1024 * 1024)  # 1MB
+    file = sized_file(1024 * 1024)  # 1MB
     validate_file_size(file, 2)  # 2MB limit
     assert True  # No exception raised
 
-def test_validate_file_size_too_large():
+def test_validate_file_size_from_file_descriptor(tmp_path):
+    """Test file size validation of a stream backed by a file on disk."""
+    path = tmp_path / 'large.pdf'
+    path.write_bytes(b'x' * (3 * 1024 * 1024))  # 3MB
+    with open(path, 'rb') as stream:
+        # The mock reports a size of 0, so only fstat sees the real size
+        file = MockFileStorage(filename='large.pdf')
+        file.stream = stream
+        with pytest.raises(ValidationError) as exc:
+            validate_file_size(file, 2)  # 2MB limit
+    assert 'exceeds maximum allowed size' in str(exc.value)
+
+def test_validate_file_size_from_spooled_upload():
+    """Test that a spooled upload already on disk is sized with fstat."""
+    with SpooledTemporaryFile(max_size=1024) as stream:
+        stream.write(b'x' * (3 * 1024 * 1024))  # 3MB, past the spool limit
+        assert stream._rolled
+        file = MockFileStorage(filename='large.pdf')
+        file.stream = stream
+        with pytest.raises(ValidationError) as exc:
+            validate_file_size(file, 2)  # 2MB limit
+    assert 'exceeds maximum allowed size' in str(exc.value)
+
+def test_stream_file_size_leaves_spooled_memory_file():
+    """Test that a spooled upload still in memory is not forced onto disk."""
+    with SpooledTemporaryFile(max_size=1024 * 1024) as stream:
+        stream.write(b'x' * 1024)
+        assert _stream_file_size(stream) == 0
+        assert not stream._rolled
+
+@pytest.mark.parametrize("size_mb", [3, 10, 100])
+def test_validate_file_size_too_large(sized_file, size_mb):
     """Test file size validation failure."""
-    file = MockFileStorage(content=b'x' * (3 * 1024 * 1024))  # 3MB
+    file = sized_file(size_mb * 1024 * 1024)
     with pytest.raises(ValidationError) as exc:
         validate_file_size(file, 2)  # 2MB limit
     assert 'exceeds maximum allowed size' in str(exc.value)
@@ -81,4 +130,19 @@ def test_error_response_with_details():
     assert response['error']['message'] == 'Test error'
     assert response['error']['status_code'] == 422
     assert response['error']['details']['field'] == 'test'
-    assert code == 422
\ No newline at end of file
+    assert code == 422
+
+def test_validate_file_size_rejects_declared_content_length():
+    """Test that a declared content length over the limit is rejected without seeking."""
+    file = MockFileStorage(content=b'x')
+    file.content_length = 3 * 1024 * 1024
+    with pytest.raises(ValidationError):
+        validate_file_size(file, 2)
+
+def test_validate_file_size_measures_despite_small_declared_length(sized_file):
+    """Test that a declared content length under the limit is not trusted."""
+    file = sized_file(3 * 1024 * 1024)  # 3MB
+    file.content_length = 1
+    with pytest.raises(ValidationError) as exc:
+        validate_file_size(file, 2)  # 2MB limit
+    assert 'exceeds maximum allowed size' in str(exc.value)